@@ -1,7 +1,7 @@
 # © 2025 NARBE House – Licensed under CC BY-NC 4.0
 
 import tkinter as tk
-from pyttsx3 import init
+from tkinter.font import Font
 import threading
 import time
 import subprocess
@@ -12,18 +12,28 @@ from pynput import keyboard
 import win32gui
 import win32process
 import win32con
-import queue
 import json
 import os
 import logging
-import requests
 import win32api
 import sys  # ensure available for control bar launcher
+import string
+import re
+import hashlib
+import tempfile
+import pickle
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Resolved once; every data/asset path below hangs off this
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
 # ADD: control bar launcher
-CONTROL_BAR_PATH = os.path.join(os.path.dirname(__file__), "utils", "control_bar.py")
+CONTROL_BAR_PATH = os.path.join(PROJECT_ROOT, "utils", "control_bar.py")
 
 def launch_control_bar(mode="basic", show_title=None):
+    flush_last_watched()  # the bar reads last_watched.json as soon as it starts
     try:
         cmd = [sys.executable, CONTROL_BAR_PATH, "--mode", mode]
         if mode == "episodes" and show_title:
@@ -36,21 +46,17 @@ def launch_control_bar(mode="basic", show_title=None):
 # ADD: global stop event for all background loops
 STOP_EVENT = threading.Event()
 
-def monitor_app_focus(app_title="Accessible Menu"):
-    # Make loop stoppable and stop touching the window once it's gone
-    while not STOP_EVENT.is_set():
-        try:
-            if not is_chrome_running():
-                hwnd = win32gui.FindWindow(None, app_title)
-                if not hwnd:
-                    break  # window no longer exists; stop this loop
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
-                win32gui.SetForegroundWindow(hwnd)
-            # else: do NOTHING
-        except Exception as e:
-            print(f"Error in monitor_app_focus: {e}")
-        time.sleep(2)
+def restore_app_focus(app_title="Accessible Menu"):
+    """Re-maximize and focus the menu while Chrome is closed. Returns False once the window is gone."""
+    if not is_chrome_running():
+        hwnd = win32gui.FindWindow(None, app_title)
+        if not hwnd:
+            return False  # window no longer exists; stop touching it
+        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
+        win32gui.SetForegroundWindow(hwnd)
+    # else: do NOTHING
+    return True
 
 # Configure logging
 logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -80,13 +86,47 @@ def monitor_and_minimize(app):
             print(f"monitor_and_minimize error: {e}")
         time.sleep(1)
 
-from psutil import process_iter
+from psutil import process_iter, Process
 
 def is_chrome_running():
     for p in process_iter(['name']):
         if p.info['name'] and 'chrome' in p.info['name'].lower():
             return True
     return False
+
+@lru_cache(maxsize=1)
+def screen_size():
+    """pyautogui.size(), asked of the OS once; the menu's display doesn't change mid-session."""
+    return tuple(pyautogui.size())
+
+def is_chrome_window(hwnd):
+    """True for a top-level Chrome window; the class name alone also matches Edge and Electron apps."""
+    if not hwnd or not win32gui.GetClassName(hwnd).startswith("Chrome_WidgetWin"):
+        return False
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    return Process(pid).name().lower() == "chrome.exe"
+
+CHROME_SETTLE = 0.5  # minimum pause after Chrome takes the foreground, for the page to paint
+
+def wait_for_chrome(page_load):
+    """
+    Wait for a Chrome window to take the foreground, never longer in total than
+    `page_load` seconds (the old fixed delay for that platform) plus CHROME_SETTLE.
+    Once the window is up, only the rest of page_load is slept, not a fresh delay.
+    Returns the Chrome window handle, or None if none came up in time.
+    """
+    deadline = time.monotonic() + page_load
+    while time.monotonic() < deadline:
+        fg = win32gui.GetForegroundWindow()
+        try:
+            found = is_chrome_window(fg)
+        except Exception:
+            found = False  # window or process vanished mid-check
+        if found:
+            time.sleep(max(deadline - time.monotonic(), CHROME_SETTLE))
+            return fg
+        time.sleep(0.05)
+    return None
         
 # Function to minimize the on-screen keyboard
 def minimize_on_screen_keyboard():
@@ -117,21 +157,32 @@ def is_start_menu_open():
     class_name = win32gui.GetClassName(hwnd)  # Get the class name of the active window
     return class_name in ["Shell_TrayWnd", "Windows.UI.Core.CoreWindow"]
 
-def monitor_start_menu():
-    """Continuously check and close the Start Menu if it is open."""
+def close_start_menu():
+    """Close the Start Menu if it is open."""
+    if is_start_menu_open():
+        print("Start Menu detected. Closing it now.")
+        send_esc_key()
+    else:
+        hwnd = win32gui.GetForegroundWindow()
+        active_window_title = win32gui.GetWindowText(hwnd)
+        print(f"Active window: {active_window_title} (Start Menu not active).")
+
+def monitor_windows(app_title="Accessible Menu"):
+    """One poller for both window chores: Start Menu every 0.5s, app focus every 2s."""
+    FOCUS_EVERY = 4  # ticks of 0.5s
+    tick = 0
+    watch_focus = True
     while not STOP_EVENT.is_set():
         try:
-            # Check if the Start Menu is active
-            if is_start_menu_open():
-                print("Start Menu detected. Closing it now.")
-                send_esc_key()
-            else:
-                hwnd = win32gui.GetForegroundWindow()
-                active_window_title = win32gui.GetWindowText(hwnd)
-                print(f"Active window: {active_window_title} (Start Menu not active).")
+            close_start_menu()
         except Exception as e:
-            print(f"Error in monitor_start_menu: {e}")
-        
+            print(f"Error closing Start Menu: {e}")
+        if watch_focus and tick % FOCUS_EVERY == 0:
+            try:
+                watch_focus = restore_app_focus(app_title)
+            except Exception as e:
+                print(f"Error restoring app focus: {e}")
+        tick += 1
         time.sleep(0.5)  # Adjust frequency as needed
 
 # List all available window titles for debugging
@@ -154,28 +205,151 @@ def log_active_window_title():
             print(f"Error logging window title: {e}")
         time.sleep(1)        
 
-# Initialize Text-to-Speech
-engine = init()
-speak_queue = queue.Queue()
+# Text-to-Speech: the engine and its worker are created on the first speak() call
+engine = None
+speak_thread = None
+_speak_start_lock = threading.Lock()
+# One-slot mailbox: appending evicts any text the worker has not picked up yet,
+# since only the newest request matters while scanning
+speak_mailbox = deque(maxlen=1)
+speak_wake = threading.Event()
+
+try:
+    import winsound  # labels already rendered to WAV are played straight from disk
+except ImportError:
+    winsound = None
+TTS_CACHE_MAX = 400  # WAVs kept; least recently played are pruned beyond this
+_wav_files = set()  # .wav names present in TTS_CACHE_DIR
+_render_backlog = deque()  # labels spoken live once, to be rendered while the worker is idle
+_voice_tag = ""     # voice+rate the cached WAVs were rendered with
+_speaking_live = False  # True only around engine.say(), never while rendering a WAV
+
+def ensure_speaker():
+    global engine, speak_thread
+    if speak_thread is not None:
+        return
+    with _speak_start_lock:
+        if speak_thread is None:
+            from pyttsx3 import init  # deferred with the engine itself
+            engine = init()
+            engine.connect("started-word", cut_off_if_superseded)
+            if winsound is not None:
+                load_wav_cache()
+            speak_thread = threading.Thread(target=play_speak_queue, daemon=True)
+            speak_thread.start()
+
+def cut_off_if_superseded(name, location, length):
+    """Engine callback: abandon the current utterance as soon as a newer one is waiting."""
+    if _speaking_live and speak_mailbox:
+        engine.stop()  # stop() from inside the engine's own loop is the safe way to interrupt it
+
+def load_wav_cache():
+    global _voice_tag
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        _voice_tag = f"{engine.getProperty('voice')}|{engine.getProperty('rate')}"
+        for name in os.listdir(TTS_CACHE_DIR):
+            if name.endswith(".wav"):
+                _wav_files.add(name)
+            else:
+                os.remove(os.path.join(TTS_CACHE_DIR, name))  # a render cut short by a crash
+        prune_wav_cache()
+    except Exception as e:
+        print(f"[TTS] WAV cache disabled: {e}")
+
+def prune_wav_cache():
+    """Drop the least recently played WAVs once there are more than TTS_CACHE_MAX."""
+    excess = len(_wav_files) - TTS_CACHE_MAX
+    if excess <= 0:
+        return
+    paths = [os.path.join(TTS_CACHE_DIR, name) for name in _wav_files]
+    def last_played(path):
+        try:
+            return os.stat(path).st_mtime  # playback touches mtime, see say_cached
+        except OSError:
+            return 0.0
+    paths.sort(key=last_played)
+    for path in paths[:excess]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        _wav_files.discard(os.path.basename(path))
+
+def wav_path(text):
+    name = hashlib.sha1(f"{_voice_tag}\0{text}".encode("utf-8")).hexdigest() + ".wav"
+    return name, os.path.join(TTS_CACHE_DIR, name)
+
+def say_cached(text):
+    """Play text's WAV if it has been rendered; returns False when it hasn't."""
+    name, path = wav_path(text)
+    if name not in _wav_files:
+        return False
+    try:
+        os.utime(path)  # mark as recently played for pruning
+        # SND_ASYNC returns at once and cuts off whatever was still playing
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+    except (OSError, RuntimeError):  # RuntimeError is how PlaySound reports a missing/bad file
+        _wav_files.discard(name)  # gone from disk (deleted or pruned elsewhere): render it again
+        return False
+    return True
+
+def render_wav(text):
+    """Render text to the WAV cache; only called while no speech is waiting."""
+    name, path = wav_path(text)
+    if name in _wav_files:
+        return
+    tmp = path + ".tmp"  # renamed into place only once SAPI has finished writing it
+    try:
+        engine.save_to_file(text, tmp)
+        engine.runAndWait()
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"[TTS] Could not render {text!r}: {e}")
+        return
+    _wav_files.add(name)
+    prune_wav_cache()
 
-def speak(text):
-    if speak_queue.qsize() >= 1:
-        with speak_queue.mutex:
-            speak_queue.queue.clear()
-    speak_queue.put(text)
+def speak(text, cache=False):
+    """Queue text for speech; cache=True for fixed labels worth keeping as WAVs."""
+    if text is None and speak_thread is None:
+        return  # nothing to shut down
+    ensure_speaker()
+    speak_mailbox.append(None if text is None else (text, cache))
+    speak_wake.set()
 
 def play_speak_queue():
+    global _speaking_live
+    use_wavs = winsound is not None and bool(_voice_tag)
     while True:
-        text = speak_queue.get()
-        if text is None:
-            speak_queue.task_done()
+        if not _render_backlog:
+            speak_wake.wait()
+        speak_wake.clear()  # cleared before popping, so a later append always re-wakes us
+        try:
+            item = speak_mailbox.popleft()
+        except IndexError:
+            if _render_backlog:  # idle: render one pending label, then look for speech again
+                render_wav(_render_backlog.popleft())
+            continue
+        if item is None:
             break
-        engine.say(text)
-        engine.runAndWait()
-        speak_queue.task_done()
-
-speak_thread = threading.Thread(target=play_speak_queue, daemon=True)
-speak_thread.start()
+        text, cache = item
+        if use_wavs and cache:
+            try:
+                if say_cached(text):
+                    continue
+            except Exception as e:
+                print(f"[TTS] Cached playback failed, speaking directly: {e}")
+            if text not in _render_backlog:
+                _render_backlog.append(text)  # first time: speak it live now, render it later
+        if use_wavs:
+            winsound.PlaySound(None, 0)  # don't talk over a WAV still playing
+        _speaking_live = True
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        finally:
+            _speaking_live = False
 
 # Function to get the active window title
 def get_active_window_name():
@@ -186,12 +360,12 @@ def get_active_window_name():
 
 # Function to close Chrome using Alt+F4
 def close_chrome_cleanly():
-    """Close Chrome browser cleanly using Alt+F4."""
+    """Close Chrome browser cleanly, as Alt+F4 would."""
     try:
-        name, _ = get_active_window_name()
-        if "Chrome" in name:
+        hwnd = win32gui.GetForegroundWindow()
+        if "Chrome" in win32gui.GetWindowText(hwnd):
             print("Chrome is active. Closing it.")
-            pyautogui.hotkey("alt", "f4")  # Close Chrome window
+            win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)  # what Alt+F4 sends, minus the synthetic keys
         else:
             print("Chrome is not the active window.")
     except Exception as e:
@@ -210,31 +384,90 @@ def bring_application_to_focus():
     except Exception as e:
         print(f"Error focusing application: {e}")
 
-import json
-import time
-import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
 import urllib.parse
-import os
 
-DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 LAST_WATCHED_FILE = os.path.join(DATA_DIR, "last_watched.json")
+TTS_CACHE_DIR = os.path.join(DATA_DIR, "tts_cache")
 
 # Function to load the last_watched.json data
+# ((mtime_ns, size), data) as last read or written; the control bar writes the file too,
+# so the stamp, not our own writes, decides when to re-parse
+_last_watched_cache = (None, {})
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
 def load_last_watched():
-    if os.path.exists(LAST_WATCHED_FILE):
+    """last_watched.json as a dict (a fresh copy), parsed again only when the file changed."""
+    global _last_watched_cache
+    try:
+        stamp = _file_stamp(LAST_WATCHED_FILE)
+    except FileNotFoundError:
+        return {}
+    cached_stamp, cached = _last_watched_cache
+    if stamp == cached_stamp:
+        return dict(cached)
+    try:
         with open(LAST_WATCHED_FILE, "r") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {}
-    return {}
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    _last_watched_cache = (stamp, data)
+    return dict(data)
 
 # Function to save the last_watched data to the file
 def save_last_watched(data):
+    global _last_watched_cache
     os.makedirs(DATA_DIR, exist_ok=True)
-    with open(LAST_WATCHED_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    # Write beside the real file and swap it in, so the control bar (or a crash)
+    # never sees a half-written last_watched.json
+    fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, LAST_WATCHED_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Write-through: the next load is a dict copy, not a re-parse of what we just wrote
+    _last_watched_cache = (_file_stamp(LAST_WATCHED_FILE), dict(data))
+
+# Single writer thread: keeps the disk write off the Tk thread and serialises the
+# read-modify-write between the URL server, the tracker and the menus
+_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="last-watched")
+
+def _update_last_watched(show, value):
+    data = load_last_watched()
+    if data.get(show) == value:
+        return False
+    data[show] = value
+    try:
+        save_last_watched(data)
+    except Exception as e:
+        print(f"[LAST-WATCHED] Save failed for {show}: {e}")  # nobody may be waiting to see it raise
+        return False
+    return True
+
+def update_last_watched(show, value):
+    """
+    Queue storing `value` under `show`; the file is only rewritten when it changed.
+    Returns a Future resolving to whether it did; background callers may wait on it.
+    """
+    return _io_executor.submit(_update_last_watched, show, value)
+
+def flush_last_watched(timeout=2.0):
+    """Block until every queued last_watched.json write has landed."""
+    try:
+        _io_executor.submit(lambda: None).result(timeout)
+    except Exception as e:
+        print(f"[LAST-WATCHED] Flush incomplete: {e}")
 
 # HTTP request handler to save URLs
 class URLSaveHandler(BaseHTTPRequestHandler):
@@ -247,11 +480,8 @@ class URLSaveHandler(BaseHTTPRequestHandler):
         show = MenuFrame.active_show
 
         if show and url:
-            # Read the existing data from last_watched.json
-            data = load_last_watched()
-            data[show] = url  # Update or add the show and URL
-            save_last_watched(data)  # Save the updated data
-            print(f"[URL-SAVED] {show} → {url}")
+            if update_last_watched(show, url).result():  # server thread, fine to wait
+                print(f"[URL-SAVED] {show} → {url}")
 
         # Send a response back to indicate success
         self.send_response(204)
@@ -265,10 +495,95 @@ def start_url_server():
 # Start the server in a background thread
 threading.Thread(target=start_url_server, daemon=True).start()
 
-import os
 import pandas as pd
 from collections import defaultdict
 
+# Parsed sheets, reused while the file's mtime and size are unchanged
+_SHEET_CACHE = OrderedDict()  # abs_path -> ((mtime_ns, size), DataFrame)
+_SHEET_CACHE_MAX = 8
+_SHEET_CACHE_LOCK = threading.Lock()  # the startup prefetch fills it from another thread
+
+def read_excel_cached(abs_path, **read_kwargs):
+    """pd.read_excel that skips the re-parse when the workbook hasn't changed on disk.
+    Keyed by path alone, so a given workbook must always be read with the same read_kwargs."""
+    st = os.stat(abs_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _SHEET_CACHE_LOCK:
+        hit = _SHEET_CACHE.get(abs_path)
+        if hit is not None and hit[0] == stamp:
+            _SHEET_CACHE.move_to_end(abs_path)
+            return hit[1]
+    df = pd.read_excel(abs_path, **read_kwargs)  # parsed outside the lock
+    with _SHEET_CACHE_LOCK:
+        _SHEET_CACHE[abs_path] = (stamp, df)
+        if len(_SHEET_CACHE) > _SHEET_CACHE_MAX:
+            _SHEET_CACHE.popitem(last=False)
+    return df
+
+def prefetch_sheets(*file_paths):
+    """Parse workbooks into the sheet cache in the background so their first page opens instantly."""
+    def work():
+        for file_path in file_paths:
+            try:
+                read_excel_cached(os.path.join(DATA_DIR, file_path))
+            except Exception as e:
+                print(f"[PREFETCH] Skipped {file_path}: {e}")
+    threading.Thread(target=work, daemon=True).start()
+
+def _read_signature(read_kwargs):
+    """Stable description of read_excel options (callables by name, not by address)."""
+    return tuple(sorted(
+        (k, getattr(v, "__qualname__", None) if callable(v) else repr(v))
+        for k, v in read_kwargs.items()
+    ))
+
+def read_excel_disk_cached(abs_path, cache_tag="v2", **read_kwargs):
+    """
+    read_excel_cached backed by a pickle next to the workbook, so a cold start skips the xlsx parse too.
+    The pickle is only trusted for the same file stamp, read options and pandas version;
+    bump cache_tag when the meaning of the options changes without their names changing.
+    """
+    cache_path = os.path.splitext(abs_path)[0] + f".cache.{cache_tag}.pkl"
+    st = os.stat(abs_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (stamp, _read_signature(read_kwargs), pd.__version__)
+    with _SHEET_CACHE_LOCK:
+        hit = _SHEET_CACHE.get(abs_path)
+        if hit is not None and hit[0] == stamp:
+            _SHEET_CACHE.move_to_end(abs_path)
+            return hit[1]
+    df = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, cached_df = pickle.load(f)
+        if cached_key == key:
+            df = cached_df
+    except FileNotFoundError:
+        pass  # no cache yet
+    except Exception as e:
+        print(f"[CACHE] Ignoring unreadable {cache_path}: {e}")
+    if df is None:
+        df = read_excel_cached(abs_path, **read_kwargs)
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((key, df), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"[CACHE] Could not write {cache_path}: {e}")
+        return df
+    with _SHEET_CACHE_LOCK:
+        _SHEET_CACHE[abs_path] = (stamp, df)
+        if len(_SHEET_CACHE) > _SHEET_CACHE_MAX:
+            _SHEET_CACHE.popitem(last=False)
+    return df
+
+# The only shows.xlsx columns anything reads; the rest are never decoded
+LINK_COLUMNS = ("type", "genre", "title", "url")
+# Names the pickled shows frame; bump it whenever LINK_COLUMNS or the read options change
+LINKS_CACHE_TAG = "links-v3"
+
+def is_link_column(name):
+    return str(name).strip().lower() in LINK_COLUMNS
+
 def load_links(file_path="shows.xlsx"):
     """
     Reads links data from an Excel file and organizes it by type and genre.
@@ -277,33 +592,37 @@ def load_links(file_path="shows.xlsx"):
       - genre
       - title
       - url
-    Returns a nested defaultdict structure.
+    Returns a nested dict structure: {type: {genre: [entry, ...]}}.
     """
     # Construct the absolute file path if needed.
-    abs_path = os.path.join(os.path.dirname(__file__),"data", file_path)
+    abs_path = os.path.join(DATA_DIR, file_path)
     
     try:
         # Read the Excel file into a DataFrame.
-        df = pd.read_excel(abs_path)
+        df = read_excel_disk_cached(
+            abs_path,
+            cache_tag=LINKS_CACHE_TAG,
+            usecols=is_link_column,
+            dtype=str,
+        )
     except Exception as e:
         print(f"[ERROR] Failed to read {file_path}: {e}")
         return {}
 
-    # Convert the DataFrame to a list of dictionaries.
-    links = df.to_dict(orient="records")
-    
+    # Normalise the keys in pandas (assign copies, the cached frame stays untouched)
+    keys = {
+        col: (df[col].fillna("misc").astype(str).str.lower() if col in df else "misc")
+        for col in ("type", "genre")
+    }
+    # One stable sort by title up front keeps every group in title order
+    df = df.assign(**keys)
+    if "title" in df:
+        df = df.sort_values("title", kind="stable")
+
     # Organize the data by type and genre.
-    organized = defaultdict(lambda: defaultdict(list))
-    for entry in links:
-        t = entry.get("type", "misc").lower()
-        genre = entry.get("genre", "misc").lower()
-        organized[t][genre].append(entry)
-        
-    # Sort the entries within each type/genre by title.
-    for t in organized:
-        for genre in organized[t]:
-            organized[t][genre].sort(key=lambda e: e.get("title", ""))
-    
+    organized = {}
+    for (t, genre), group in df.groupby(["type", "genre"], sort=False):
+        organized.setdefault(t, {})[genre] = group.to_dict(orient="records")
     return organized
 
 def load_communication_phrases(file_path="communication.xlsx"):
@@ -312,9 +631,10 @@ def load_communication_phrases(file_path="communication.xlsx"):
     | Category | Display | Text to Speech |
     Returns a dict: { "Category1": [(label1, speak1), (label2, speak2), ...], ... }
     """
-    abs_path = os.path.join(os.path.dirname(__file__), "data", file_path)
+    abs_path = os.path.join(DATA_DIR, file_path)
     try:
-        df = pd.read_excel(abs_path)
+        # Re-read on every visit to the Communication page, so this is where the cache pays off
+        df = read_excel_cached(abs_path)
     except Exception as e:
         print(f"[ERROR] Failed to load communication.xlsx: {e}")
         return {}
@@ -338,17 +658,12 @@ def load_episode_catalog():
     Expected columns (case-insensitive):
         Show Title | Season Number | Episode Number | Episode Title | DisneyPlusURL (or Episode URL)
     """
-    import pandas as pd
-    import os
-    from pathlib import Path
-
-    base_dir = os.path.join(os.path.dirname(__file__), "data")
-    sheet_path = Path(base_dir) / EPISODE_SHEET_NAME
-    if not sheet_path.exists():
+    sheet_path = os.path.join(DATA_DIR, EPISODE_SHEET_NAME)
+    try:
+        df = pd.read_excel(sheet_path)  # a missing sheet surfaces here, no separate exists() stat
+    except FileNotFoundError:
         print(f"[EPISODES] Not found: {sheet_path}")
         return
-
-    df = pd.read_excel(sheet_path)
     cols = {c.lower().strip(): c for c in df.columns}
 
     show_col   = cols.get("show title") or cols.get("show") or cols.get("title") or cols.get("series")
@@ -406,21 +721,82 @@ def get_last_position(show_title):
     return None, None, ""
 
 def set_last_position(show_title, season, episode, url):
-    data = load_last_watched()
-    data[show_title] = {"season": int(season), "episode": int(episode), "url": url}
-    save_last_watched(data)
+    update_last_watched(show_title, {"season": int(season), "episode": int(episode), "url": url})
     print(f"[SAVE] {show_title} → S{season:02d}E{episode:02d} ({url})")
 
-def shrink_button_font(button, max_width_px=250, min_pt=18, base_pt=32, family="Arial Black"):
-    from tkinter.font import Font
-    text = button.cget("text")
+_REF_PT = 32
+_REF_FONTS = {}    # family -> Font at _REF_PT, used only to fill _CHAR_WIDTHS
+_CHAR_WIDTHS = {}  # family -> {char: px at _REF_PT}
+_FIT_SIZES = OrderedDict()  # (text, family, max_width_px, min_pt, base_pt) -> fitted pt, LRU order
+_FIT_SIZES_MAX = 1024  # labels come and go as episode/link pages change; keep the recent ones
+
+def text_width(text, pt, family="Arial Black"):
+    """Estimate text's pixel width at pt from per-character widths measured once."""
+    widths = _CHAR_WIDTHS.get(family)
+    if widths is None:
+        ref = _REF_FONTS[family] = Font(family=family, size=_REF_PT)
+        widths = _CHAR_WIDTHS[family] = {c: ref.measure(c) for c in string.printable}
+    total = 0
+    for c in text:
+        w = widths.get(c)
+        if w is None:  # non-ASCII (e.g. en dash in episode labels): measure once, keep it
+            w = widths[c] = _REF_FONTS[family].measure(c)
+        total += w
+    return total * pt / _REF_PT
+
+def fit_font_size(text, max_width_px=250, min_pt=18, base_pt=32, family="Arial Black"):
+    """Step down from base_pt by 2 until text fits max_width_px; memoized per label."""
+    key = (text, family, max_width_px, min_pt, base_pt)
+    pt = _FIT_SIZES.get(key)
+    if pt is not None:
+        _FIT_SIZES.move_to_end(key)
+        return pt
+    ref_width = text_width(text, _REF_PT, family)
     pt = base_pt
     while pt >= min_pt:
-        f = Font(family=family, size=pt)
-        if f.measure(text) <= max_width_px:
+        if ref_width * pt / _REF_PT <= max_width_px:
             break
         pt -= 2
-    button.config(font=(family, pt))
+    _FIT_SIZES[key] = pt
+    if len(_FIT_SIZES) > _FIT_SIZES_MAX:
+        _FIT_SIZES.popitem(last=False)
+    return pt
+
+def shrink_button_font(button, max_width_px=250, min_pt=18, base_pt=32, family="Arial Black"):
+    pt = fit_font_size(button.cget("text"), max_width_px, min_pt, base_pt, family)
+    button.config(font=button_font(pt, family))
+
+_BUTTON_FONTS = {}  # (family, pt) -> Font shared by every button at that size
+
+def button_font(pt=36, family="Arial Black"):
+    """Shared Font object, so Tk resolves each family/size once instead of per widget."""
+    font = _BUTTON_FONTS.get((family, pt))
+    if font is None:
+        font = _BUTTON_FONTS[(family, pt)] = Font(family=family, size=pt)
+    return font
+
+# Scan colours, applied with btn.config(**style)
+IDLE_STYLE = {"bg": "light blue", "fg": "black"}
+HIGHLIGHT_STYLE = {"bg": "yellow", "fg": "black"}
+
+def move_highlight(buttons, index, lit):
+    """
+    Recolour buttons for a scan step and return the new lit state (buttons, index).
+    Only the outgoing and incoming buttons are touched; every button is restyled
+    just when the button list itself has changed since the last step.
+    """
+    lit_buttons, lit_index = lit
+    if lit_buttons is buttons and lit_index is not None and lit_index < len(buttons):
+        try:
+            if lit_index != index:
+                buttons[lit_index].config(**IDLE_STYLE)
+                buttons[index].config(**HIGHLIGHT_STYLE)
+            return buttons, index
+        except tk.TclError:
+            pass  # a button was destroyed under us; fall back to the full pass
+    for i, btn in enumerate(buttons):
+        btn.config(**(HIGHLIGHT_STYLE if i == index else IDLE_STYLE))
+    return buttons, index
 
 # ADD: unified, safe shutdown for all threads and resources
 def graceful_exit(app):
@@ -434,13 +810,17 @@ def graceful_exit(app):
         except Exception:
             pass
 
+        # land any queued last_watched.json write before the process goes
+        flush_last_watched()
+
         # stop TTS thread
         try:
-            speak_queue.put(None)  # sentinel for play_speak_queue
+            speak(None)  # sentinel for play_speak_queue
         except Exception:
             pass
         try:
-            engine.stop()
+            if engine is not None:
+                engine.stop()
         except Exception:
             pass
 
@@ -469,10 +849,11 @@ def graceful_exit(app):
         # ensure process ends even if some non-daemon thread lingers
         os._exit(0)
 
-import ctypes
-import pyautogui
 from pynput.keyboard import Controller
 
+SCAN_DEBOUNCE_S = 0.5    # scan keys ignored this long after each step
+SELECT_DEBOUNCE_S = 2.0  # and this long after a selection
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -483,8 +864,11 @@ class App(tk.Tk):
         self.current_frame = None
         self.buttons = []  # Holds buttons for scanning
         self.current_button_index = 0  # Current scanning index
-        self.selection_enabled = True  # Flag to manage debounce for selection
+        self._selection_ready_at = 0.0  # monotonic time scanning/selection unlocks again
+        self._lit = (None, None)  # (button list, index) currently highlighted
         self.keyboard = Controller()  # Initialize the keyboard controller
+        # Warm the Communication sheet while shows.xlsx loads and the main menu is up
+        prefetch_sheets("communication.xlsx")
         self.organized_links = load_links("shows.xlsx")
         self.spacebar_pressed = False
         self.long_spacebar_pressed = False
@@ -501,11 +885,8 @@ class App(tk.Tk):
         # Start monitoring for Chrome in a separate thread
         threading.Thread(target=monitor_and_minimize, args=(self,), daemon=True).start()
 
-        # Start monitoring for Chrome's state and application focus
-        threading.Thread(target=monitor_app_focus, args=("Accessible Menu",), daemon=True).start()
-
-        # Start monitoring the Start Menu
-        threading.Thread(target=monitor_start_menu, daemon=True).start()
+        # Keep the app focused while Chrome is closed and close the Start Menu (one thread)
+        threading.Thread(target=monitor_windows, args=("Accessible Menu",), daemon=True).start()
 
         # Delay key bindings to ensure focus
         self.after(3000, self.bind_keys_for_scanning)
@@ -611,49 +992,43 @@ class App(tk.Tk):
         else:
             self.show_frame(MainMenuPage)
 
+    # Debounce is a timestamp compared on each key, not a Timer thread per press
+    @property
+    def selection_enabled(self):
+        return time.monotonic() >= self._selection_ready_at
+
+    @selection_enabled.setter
+    def selection_enabled(self, enabled):
+        self._selection_ready_at = 0.0 if enabled else float("inf")
+
+    def hold_selection(self, seconds):
+        """Ignore scan/select keys for the next `seconds`."""
+        self._selection_ready_at = time.monotonic() + seconds
+
     def scan_forward(self):
-        if not self.selection_enabled:
-            return
-        # existing scanning logic here      
         if not self.selection_enabled or not self.buttons:
             return
-        self.selection_enabled = False  # Disable selection temporarily
-        
+        self.hold_selection(SCAN_DEBOUNCE_S)
+
         self.current_button_index = (self.current_button_index + 1) % len(self.buttons)
         self.highlight_button(self.current_button_index)
-           
-        # Speak the button's text if the frame matches
-        if isinstance(self.current_frame, (
-            MainMenuPage, EntertainmentMenuPage, SettingsMenuPage,
-            LibraryMenu, GamesPage, CommunicationPageMenu,
-            SeasonPickerMenu, EpisodeListMenu
-        )):
-            speak(self.buttons[self.current_button_index]["text"])
-
-        # Re-enable selection after a short delay
-        threading.Timer(0.5, self.enable_selection).start()
+        self.speak_scanned_button()
 
     def scan_backward(self, event=None):
         """Move to the previous button and highlight it."""
         if not self.selection_enabled or not self.buttons:
             return
 
-        self.selection_enabled = False  # Disable selection temporarily
+        self.hold_selection(SCAN_DEBOUNCE_S)
         self.current_button_index = (self.current_button_index - 1) % len(self.buttons)
         self.highlight_button(self.current_button_index)
+        self.speak_scanned_button()
 
-        # Speak the button's text if the frame matches
-        if isinstance(self.current_frame, (
-            MainMenuPage, EntertainmentMenuPage,  SettingsMenuPage,
-            LibraryMenu, GamesPage, CommunicationPageMenu,
-            SeasonPickerMenu, EpisodeListMenu
-          
-        )):
-            speak(self.buttons[self.current_button_index]["text"])
-
-        # Re-enable selection after a short delay
-        threading.Timer(0.5, self.enable_selection).start()
 
+    def speak_scanned_button(self):
+        """Speak the highlighted button's text if the current frame reads its buttons aloud."""
+        if isinstance(self.current_frame, SPOKEN_SCAN_FRAMES):
+            speak(self.buttons[self.current_button_index]["text"], cache=True)
 
     def enable_selection(self):
         """Re-enable scanning and selection after the delay."""
@@ -662,19 +1037,15 @@ class App(tk.Tk):
     def select_button(self, event=None):
         """Select the currently highlighted button upon Enter key release with debounce and delay."""
         if self.selection_enabled and self.buttons:
-            self.selection_enabled = False  # Disable selection temporarily
+            self.selection_enabled = False  # held while the action runs
             self.buttons[self.current_button_index].invoke()  # Invoke the button action
 
             # Add delay for both scanning and selection after Enter key
-            threading.Timer(2, self.enable_selection).start()  # Re-enable selection after 2 seconds
+            self.hold_selection(SELECT_DEBOUNCE_S)
 
     def highlight_button(self, index):
-        for i, btn in enumerate(self.buttons):
-            if i == index:
-                btn.config(bg="yellow", fg="black")
-            else:
-                btn.config(bg="light blue", fg="black")
-        self.update()  # Refresh appearance
+        # Tk repaints on its next idle pass; no forced update() per scan step
+        self._lit = move_highlight(self.buttons, index, self._lit)
 
         # Auto-scroll so that the highlighted button is visible.
         if hasattr(self, "scroll_canvas"):
@@ -692,10 +1063,47 @@ class App(tk.Tk):
                 print(f"Error auto-scrolling: {e}")
 
     
+# Streaming platform of a link URL, found in one scan instead of a chain of substring tests
+PLATFORM_RE = re.compile(
+    r"(?P<paramount_live>paramountplus\.com/live-tv)|(?P<plex>plex\.tv)|(?P<youtube>youtube\.com|youtu\.be)"
+    r"|(?P<pluto>pluto\.tv)|(?P<amazon>amazon\.com)|(?P<spotify>spotify\.com)"
+)
+
+def platform_of(url):
+    """Name of the PLATFORM_RE group matching url, or None for anything else."""
+    m = PLATFORM_RE.search(url)
+    return m.lastgroup if m else None
+
+# Held while a link's opener runs; only the Tk thread acquires it
+_launch_lock = threading.Lock()
+
 # Base Frame for Menu Pages
 class MenuFrame(tk.Frame):
     active_show = None  # Class-level variable to track the active show
 
+    # (content type, platform) -> (description, opener); platform None is the type's fallback
+    LINK_OPENERS = {
+        ("shows", "plex"): ("Plex Show", lambda self, title, url: self.open_plex(url, title)),
+        ("shows", "youtube"): ("YouTube Show", lambda self, title, url: self.open_youtube(url, title)),
+        ("shows", "paramount_live"): ("Paramount+ Live TV", lambda self, title, url: self.open_and_click(title, url)),
+        ("shows", "pluto"): ("Pluto.tv Show", lambda self, title, url: self.open_pluto(title, url)),
+        ("shows", "amazon"): ("Amazon Show", lambda self, title, url: self.open_and_click(title, url)),
+        ("shows", None): ("Non-Plex Show", lambda self, title, url: self.open_in_chrome(title, url)),
+        ("live", "paramount_live"): ("Paramount+ Live Stream", lambda self, title, url: self.open_and_click(title, url)),
+        ("live", "pluto"): ("Pluto.tv Live Stream", lambda self, title, url: self.open_pluto(title, url)),
+        ("live", "youtube"): ("YouTube Live Stream", lambda self, title, url: self.open_youtube(title, url)),
+        ("live", "amazon"): ("Amazon Live", lambda self, title, url: self.open_and_click(title, url)),
+        ("live", None): ("General Live Content", lambda self, title, url: self.open_in_chrome(title, url)),
+        ("movies", "plex"): ("Plex Movie", lambda self, title, url: self.open_plex_movies(url, title)),
+        ("movies", "amazon"): ("Amazon Movie", lambda self, title, url: self.open_and_click(title, url)),
+        ("movies", None): ("Other Movie Content", lambda self, title, url: self.movies_in_chrome(title, url)),
+        ("music", "spotify"): ("Spotify", lambda self, title, url: self.open_spotify(url)),
+        ("music", None): ("Other Music Source", lambda self, title, url: self.open_in_chrome(title, url)),
+        ("audiobooks", "plex"): ("Plex Audiobook", lambda self, title, url: self.open_plex_movies(url, title)),
+        ("audiobooks", None): ("Other Audiobook Source", lambda self, title, url: self.movies_in_chrome(title, url)),
+    }
+    UNKNOWN_TYPE_OPENER = ("Unknown content type", lambda self, title, url: self.movies_in_chrome(title, url))
+
     def __init__(self, parent, title):
         super().__init__(parent, bg="black")
         self.parent = parent
@@ -726,7 +1134,7 @@ class MenuFrame(tk.Frame):
             btn = tk.Button(
                 grid_frame,
                 text=text,
-                font=("Arial Black", 36),
+                font=button_font(),
                 bg="light blue",
                 fg="black",
                 activebackground="yellow",
@@ -791,16 +1199,16 @@ class MenuFrame(tk.Frame):
         """Open the given URL, click on the specified position, and ensure fullscreen mode."""
         # Use the same logic as open_in_chrome to open the URL
         self.movies_in_chrome(show_name, default_url)
-        time.sleep(5)  # Wait for the browser to open and load
+        hwnd = wait_for_chrome(5)  # Wait for the browser to open and load
 
         # Bring the browser window to the foreground
-        hwnd = win32gui.GetForegroundWindow()
+        hwnd = hwnd or win32gui.GetForegroundWindow()
         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
         win32gui.SetForegroundWindow(hwnd)
         print("Brought Chrome to the foreground.")
 
         # Calculate click position with offsets
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = screen_size()
         click_x = (screen_width // 2) + x_offset
         click_y = (screen_height // 2) + y_offset
 
@@ -819,10 +1227,10 @@ class MenuFrame(tk.Frame):
         
         # Open the URL in Chrome
         self.open_in_chrome(show_name, pluto_url)
-        time.sleep(7)  # Wait for page and video player to load
+        hwnd = wait_for_chrome(7)  # Wait for page and video player to load
 
         # Bring Chrome to the foreground
-        hwnd = win32gui.GetForegroundWindow()
+        hwnd = hwnd or win32gui.GetForegroundWindow()
         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
         win32gui.SetForegroundWindow(hwnd)
         print("Brought Chrome to the foreground.")
@@ -898,10 +1306,10 @@ class MenuFrame(tk.Frame):
         
         # Wait for the page to load.
         print("[DEBUG] Waiting for Chrome/Spotify page to load...")
-        time.sleep(12)
+        wait_for_chrome(12)
         
         # Define the absolute path to your reference image.
-        play_image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", "spotifyplay.png")
+        play_image_path = os.path.join(PROJECT_ROOT, "images", "spotifyplay.png")
         if not os.path.exists(play_image_path):
             print(f"[DEBUG] Reference image not found: {play_image_path}")
             location = None
@@ -958,10 +1366,8 @@ class MenuFrame(tk.Frame):
 
             # Check if the current URL matches the base URL and save it
             if current_url and current_url.startswith(base):
-                data = load_last_watched()
-                data[show_name] = current_url
-                save_last_watched(data)
-                print(f"[SAVED] {show_name} → {current_url}")
+                if update_last_watched(show_name, current_url).result():
+                    print(f"[SAVED] {show_name} → {current_url}")
             else:
                 print(f"[SKIP] No save for {show_name}, URL: {current_url}")
 
@@ -983,7 +1389,7 @@ class MenuFrame(tk.Frame):
         self.movies_in_chrome(show_name, plex_url)
         
         # Wait for the Plex page to load fully.
-        time.sleep(7)  # Adjust as necessary for your system.
+        wait_for_chrome(7)  # Adjust as necessary for your system.
         
         # Send the keyboard commands.
         pyautogui.press('x')
@@ -1005,7 +1411,7 @@ class MenuFrame(tk.Frame):
         self.open_in_chrome(show_name, plex_url)
         
         # Wait for the Plex page to load fully.
-        time.sleep(7)  # Adjust as necessary for your system.
+        wait_for_chrome(7)  # Adjust as necessary for your system.
         
         # Send the keyboard commands.
         pyautogui.press('x')
@@ -1020,7 +1426,7 @@ class MenuFrame(tk.Frame):
         # Open youtube using your common method.
         self.movies_in_chrome(show_name, youtube_url)
         # Wait for the Youtube page to load fully.
-        time.sleep(5)  # Adjust as necessary for your system.
+        wait_for_chrome(5)  # Adjust as necessary for your system.
         # Send the keyboard commands.
         pyautogui.press('f')
         print("Sent keys: f")
@@ -1030,6 +1436,10 @@ class MenuFrame(tk.Frame):
         url = entry["url"]
         content_type = entry.get("type", "movies").lower()
 
+        if _launch_lock.locked():
+            print(f"[LAUNCH] Still opening the previous title; ignoring {title}")
+            return
+
         print(f"[DEBUG] Requested: {title} - URL: {url} (Type: {content_type})")
 
         # 1) Tell the URL‐save extension/server which show key to use
@@ -1055,76 +1465,26 @@ class MenuFrame(tk.Frame):
         print(f"[DEBUG] Final URL for {title}: {url}")
 
         # 3) Dispatch by type/platform
-        if content_type == "shows":
-            if "plex.tv" in url:
-                print(f"[DEBUG] Detected Plex Show → open_plex({title})")
-                self.open_plex(url, title)
-            elif "youtube.com" in url or "youtu.be" in url:
-                print(f"[DEBUG] Detected YouTube Show → open_youtube({title})")
-                self.open_youtube(url, title)
-            elif "paramountplus.com/live-tv" in url:
-                print(f"[DEBUG] Detected Paramount+ Live TV → open_and_click({title})")
-                self.open_and_click(title, url)
-            elif "pluto.tv" in url:
-                print(f"[DEBUG] Detected Pluto.tv Show → open_pluto({title})")
-                self.open_pluto(title, url)
-            elif "amazon.com" in url:
-                print(f"[DEBUG] Detected Amazon Show → open_and_click({title})")
-                self.open_and_click(title, url)
-            else:
-                print(f"[DEBUG] Non-Plex Show → open_in_chrome({title})")
-                self.open_in_chrome(title, url)
-
-        elif content_type == "live":
-            if "paramountplus.com/live-tv" in url:
-                print(f"[DEBUG] Detected Paramount+ Live Stream → open_and_click({title})")
-                self.open_and_click(title, url)
-            elif "pluto.tv" in url:
-                print(f"[DEBUG] Detected Pluto.tv Live Stream → open_pluto({title})")
-                self.open_pluto(title, url)
-            elif "youtube.com" in url or "youtu.be" in url:
-                print(f"[DEBUG] Detected YouTube Live Stream → open_youtube({title})")
-                self.open_youtube(title, url)
-            elif "amazon.com" in url:
-                print(f"[DEBUG] Detected Amazon Live → open_and_click({title})")
-                self.open_and_click(title, url)
-            else:
-                print(f"[DEBUG] General Live Content → open_in_chrome({title})")
-                self.open_in_chrome(title, url)
-
-        elif content_type == "movies":
-            if "plex.tv" in url:
-                print(f"[DEBUG] Detected Plex Movie → open_plex_movies({title})")
-                self.open_plex_movies(url, title)
-            elif "amazon.com" in url:
-                print(f"[DEBUG] Detected Amazon Movie → open_and_click({title})")
-                self.open_and_click(title, url)
-            else:
-                print(f"[DEBUG] Other Movie Content → movies_in_chrome({title})")
-                self.movies_in_chrome(title, url)
-
-        elif content_type == "music":
-            if "spotify.com" in url:
-                print(f"[DEBUG] Detected Spotify → open_spotify({title})")
-                self.open_spotify(url)
-            else:
-                print(f"[DEBUG] Other Music Source → open_in_chrome({title})")
-                self.open_in_chrome(title, url)
-
-        elif content_type == "audiobooks":
-            if "plex.tv" in url:
-                print(f"[DEBUG] Detected Plex Audiobook → open_plex_movies({title})")
-                self.open_plex_movies(url, title)
-            else:
-                print(f"[DEBUG] Other Audiobook Source → movies_in_chrome({title})")
-                self.movies_in_chrome(title, url)
-
-        else:
-            print(f"[DEBUG] Unknown content type '{content_type}' → movies_in_chrome({title})")
-            self.movies_in_chrome(title, url)
+        site = platform_of(url)
+        label, opener = (
+            self.LINK_OPENERS.get((content_type, site))
+            or self.LINK_OPENERS.get((content_type, None))
+            or self.UNKNOWN_TYPE_OPENER
+        )
+        print(f"[DEBUG] {label} ({content_type}/{site or 'other'}) → {title}")
 
-        # ADD: launch control bar in basic mode for normal links (episodes flow returns earlier)
-        launch_control_bar("basic")
+        # Openers sleep while Chrome loads, so they run on a worker and the menu stays live
+        _launch_lock.acquire()
+        def launch():
+            try:
+                opener(self, title, url)
+                # ADD: launch control bar in basic mode for normal links (episodes flow returns earlier)
+                launch_control_bar("basic")
+            except Exception as e:
+                print(f"[ERROR] Opening {title} failed: {e}")
+            finally:
+                _launch_lock.release()
+        threading.Thread(target=launch, daemon=True).start()
 
     def goto_shows_root(self):
         """Jump to the root Shows menu sourced from shows.xlsx."""
@@ -1139,8 +1499,6 @@ class MenuFrame(tk.Frame):
         if self.parent.buttons:
             self.parent.highlight_button(self.parent.current_button_index)
 
-import sys
-
 # Define Menu Classes
 class MainMenuPage(MenuFrame):
     def __init__(self, parent):
@@ -1148,6 +1506,7 @@ class MainMenuPage(MenuFrame):
         self.buttons = []  # Store buttons for scanning
         self.current_button_index = 0  # Initialize scanning index
         self.selection_enabled = True  # Flag to manage debounce for selection
+        self._lit = (None, None)  # (button list, index) currently highlighted
 
         # Create the grid layout for 4 large buttons
         grid_frame = tk.Frame(self, bg="black")
@@ -1166,7 +1525,7 @@ class MainMenuPage(MenuFrame):
             btn = tk.Button(
                 grid_frame,
                 text=text,
-                font=("Arial Black", 36),
+                font=button_font(),
                 bg="light blue",
                 fg="black",
                 activebackground="yellow",
@@ -1193,16 +1552,11 @@ class MainMenuPage(MenuFrame):
             self.selection_enabled = False  # Disable selection temporarily to debounce
             self.current_button_index = (self.current_button_index + 1) % len(self.buttons)
             self.highlight_button(self.current_button_index)
-            threading.Timer(0.5, self.enable_selection).start()  # Re-enable selection after a delay
+            self.after(int(SCAN_DEBOUNCE_S * 1000), self.enable_selection)  # Re-enable selection after a delay
 
     def highlight_button(self, index):
-        """Highlight the current button and reset others."""
-        for i, button in enumerate(self.buttons):
-            if i == index:
-                button.config(bg="yellow", fg="black")  # Highlight current button
-            else:
-                button.config(bg="light blue", fg="black")  # Reset others
-        self.update()
+        """Highlight the current button and reset the one lit before it."""
+        self._lit = move_highlight(self.buttons, index, self._lit)
 
     def enable_selection(self):
         """Re-enable selection after a delay."""
@@ -1263,7 +1617,7 @@ class CommunicationPageMenu(MenuFrame):
     def open_keyboard_app(self):
         try:
             script_name = "keyboard.py"
-            script_path = os.path.join(os.path.dirname(__file__), "keyboard", script_name)
+            script_path = os.path.join(PROJECT_ROOT, "keyboard", script_name)
             subprocess.Popen([sys.executable, script_path])
             self.master.destroy()
         except Exception as e:
@@ -1280,12 +1634,6 @@ class CommunicationCategoryMenu(MenuFrame):
         self.create_button_grid(buttons, columns=3)
 
 
-import subprocess
-import pyautogui
-import time
-import win32gui
-import win32con
-
 class SettingsMenuPage(MenuFrame):
     def __init__(self, parent):
         super().__init__(parent, "Settings")  # Set the title to "Settings"
@@ -1316,7 +1664,7 @@ class SettingsMenuPage(MenuFrame):
         for i, (text, command, speak_text) in enumerate(buttons):
             row, col = divmod(i, columns)
             btn = tk.Button(
-                grid_frame, text=text, font=("Arial Black", 36), bg="light blue", fg="black",
+                grid_frame, text=text, font=button_font(), bg="light blue", fg="black",
                 activebackground="yellow", activeforeground="black",
                 command=lambda c=command, s=speak_text: self.on_select(c, s)
             )
@@ -1427,7 +1775,7 @@ class EntertainmentMenuPage(MenuFrame):
         for i, (text, command, speak_text) in enumerate(buttons):
             row, col = divmod(i, columns)
             btn = tk.Button(
-                grid_frame, text=text, font=("Arial Black", 36), bg="light blue", fg="black",
+                grid_frame, text=text, font=button_font(), bg="light blue", fg="black",
                 activebackground="yellow", activeforeground="black",
                 command=lambda c=command, s=speak_text: self.on_select(c, s)
             )
@@ -1454,7 +1802,7 @@ from functools import partial
 class GamesPage(MenuFrame):
     """Games menu that auto‑populates from Python scripts inside ./games."""
 
-    GAMES_DIR = os.path.join(os.path.dirname(__file__), "games")
+    GAMES_DIR = os.path.join(PROJECT_ROOT, "games")
 
     def __init__(self, parent):
         super().__init__(parent, "Games")
@@ -1473,11 +1821,13 @@ class GamesPage(MenuFrame):
         """Return a list of (label, command, speak_text) tuples for each game script."""
         games = []
 
-        if not os.path.isdir(self.GAMES_DIR):
+        try:
+            files = sorted(os.listdir(self.GAMES_DIR))
+        except OSError:
             print(f"[GamesPage] Folder not found: {self.GAMES_DIR}")
             return games
 
-        for file in sorted(os.listdir(self.GAMES_DIR)):
+        for file in files:
             # Only include Python scripts; skip dunders and non‑py files
             if not file.endswith(".py") or file.startswith("__"):
                 continue
@@ -1508,7 +1858,7 @@ class GamesPage(MenuFrame):
             btn = tk.Button(
                 grid,
                 text=text,
-                font=("Arial Black", 36),
+                font=button_font(),
                 bg="light blue",
                 fg="black",
                 activebackground="yellow",
@@ -1533,9 +1883,6 @@ class GamesPage(MenuFrame):
             print(f"[GamesPage] Failed to open {title}: {e}")
             speak("Unable to launch the selected game.")
 
-from collections import defaultdict
-import tkinter as tk
-from tkinter.font import Font
 
 class LibraryMenu(MenuFrame):
     def __init__(self, parent, data, level, parent_key=None):
@@ -1553,6 +1900,11 @@ class LibraryMenu(MenuFrame):
         self.data = data
         self.level = level
         self.parent_key = parent_key
+        # Title -> first entry with that title, so picking a show is one dict lookup
+        self.entries_by_title = {}
+        if level == "final":
+            for entry in data:
+                self.entries_by_title.setdefault(entry["title"], entry)
         self.page = 0            # current page index
         self.page_size = 7       # show 7 selection buttons per page
 
@@ -1568,38 +1920,25 @@ class LibraryMenu(MenuFrame):
         # Use a container frame for our grid.
         self.container = tk.Frame(self, bg="black")
         self.container.pack(expand=True, fill="both")
+        self.build_button_pool()
         self.reload_buttons()
 
     def adjust_font_size(self, button, max_width=250, min_font_size=18):
-        button.update_idletasks()  # Update widget geometry
         text = button.cget("text")
         # Use the persistent font family and weight
         font_family = "Arial Black"
-        font_size = 32
-
-        while font_size >= min_font_size:
-            test_font = Font(family=font_family, size=font_size)
-            if test_font.measure(text) <= max_width:
-                break
-            font_size -= 2
-
-        # Update the persistent font or create a new one with the same family and desired size.
-        new_font = Font(family=font_family, size=font_size)
-        button.config(font=new_font)
+        font_size = fit_font_size(text, max_width, min_font_size, 32, font_family)
+        button.config(font=button_font(font_size, font_family))
 
     def adjust_all_buttons(self):
         """Call adjust_font_size on each button in the current menu."""
         for btn in self.buttons:
             self.adjust_font_size(btn, max_width=250, min_font_size=18,)
+        # Runs from after(), so Tk lays the grid out once on its own idle pass
 
 
     def reload_buttons(self):
-        # Clear the container.
-        for widget in self.container.winfo_children():
-            widget.destroy()
-
-        button_list = []
-
+        # Pool buttons are relabelled in place; nothing is destroyed on a page turn
         # --- Decide what Back should do ---
         if self.page > 0:
             back_command = self.previous_page
@@ -1609,18 +1948,6 @@ class LibraryMenu(MenuFrame):
             else:
                 back_command = lambda: self.parent.show_previous_menu()
 
-        back_btn = tk.Button(
-            self.container,
-            text="Back",
-            font=("Arial Black", 36),
-            bg="light blue",
-            fg="black",
-            command=back_command,
-            wraplength=700,
-            justify="center"
-        )
-        button_list.append(back_btn)
-
         # Build the keys list based on the current level.
         if self.level == "genre":
             keys = sorted(self.data.keys())
@@ -1634,56 +1961,50 @@ class LibraryMenu(MenuFrame):
         end = start + self.page_size
         page_keys = keys[start:end]
 
-        for key in page_keys:
-            btn = tk.Button(
-                self.container,
-                text=key,
-                font=("Arial Black", 36),
-                bg="light blue",
-                fg="black",
-                command=lambda k=key: self.on_select(k),
-                wraplength=700,  # Allow wrapping to use two lines
-                justify="center"
-            )
-            button_list.append(btn)
-
+        labels = [("Back", back_command)]
+        labels += [(key, lambda k=key: self.on_select(k)) for key in page_keys]
         # If there are more keys beyond this page, add a Next button.
         if end < len(keys):
-            next_btn = tk.Button(
+            labels.append(("Next", self.next_page))
+
+        button_list = []
+        for btn, (text, command) in zip(self.button_pool, labels):
+            btn.config(text=text, command=command, font=button_font(), **IDLE_STYLE)
+            btn.grid()
+            button_list.append(btn)
+        for btn in self.button_pool[len(labels):]:
+            btn.grid_remove()
+
+        # Save the new button list for scanning.
+        self.buttons = button_list
+
+        # Update the parent's scanning state (after a short delay to allow the UI to update).
+        self.after(50, self.update_scanning)
+        # After a short delay, adjust the font sizes on all buttons.
+        self.after(100, self.adjust_all_buttons)
+
+    def build_button_pool(self):
+        """Create and grid Back + a full page + Next once; pages only relabel them."""
+        num_cols = 3
+        self.button_pool = []
+        for idx in range(self.page_size + 2):
+            btn = tk.Button(
                 self.container,
-                text="Next",
-                font=("Arial Black", 36),
+                font=button_font(),
                 bg="light blue",
                 fg="black",
-                command=self.next_page,
-                wraplength=700,
+                wraplength=700,  # Allow wrapping to use two lines
                 justify="center"
             )
-            button_list.append(next_btn)
-
-        # Arrange all buttons in a grid (using 3 columns).
-        num_cols = 3
-        num_buttons = len(button_list)
-        num_rows = (num_buttons + num_cols - 1) // num_cols
-
-        for idx, btn in enumerate(button_list):
-            row = idx // num_cols
-            col = idx % num_cols
+            row, col = divmod(idx, num_cols)
             btn.grid(row=row, column=col, sticky="nsew", padx=10, pady=10)
+            self.button_pool.append(btn)
 
-        for r in range(num_rows):
+        for r in range((len(self.button_pool) + num_cols - 1) // num_cols):
             self.container.grid_rowconfigure(r, weight=1)
         for c in range(num_cols):
             self.container.grid_columnconfigure(c, weight=1)
 
-        # Save the new button list for scanning.
-        self.buttons = button_list
-
-        # Update the parent's scanning state (after a short delay to allow the UI to update).
-        self.after(50, self.update_scanning)
-        # After a short delay, adjust the font sizes on all buttons.
-        self.after(100, self.adjust_all_buttons)
-
     def update_scanning(self):
         self.parent.buttons = self.buttons
         self.parent.current_button_index = 0
@@ -1714,10 +2035,9 @@ class LibraryMenu(MenuFrame):
             self.parent.show_frame(lambda p: LibraryMenu(p, new_data, "final", parent_key=key))
         elif self.level == "final":
             # Find the entry with a matching title and open its link.
-            for entry in self.data:
-                if entry["title"] == key:
-                    self.open_link(entry)
-                    break
+            entry = self.entries_by_title.get(key)
+            if entry is not None:
+                self.open_link(entry)
 
 # === 3×3 EPISODE MENUS ===
 class SeasonPickerMenu(MenuFrame):
@@ -1870,6 +2190,13 @@ class EpisodeListMenu(MenuFrame):
         # ADD: overlay in episodes mode when an episode starts
         launch_control_bar("episodes", self.show_title)
 
+# Frames whose buttons are spoken while scanning; built once, after the classes exist
+SPOKEN_SCAN_FRAMES = (
+    MainMenuPage, EntertainmentMenuPage, SettingsMenuPage,
+    LibraryMenu, GamesPage, CommunicationPageMenu,
+    SeasonPickerMenu, EpisodeListMenu,
+)
+
 # Run the App
 if __name__ == "__main__":
     app = App()
@@ -5,6 +5,7 @@ from functools import partial
 import random
 import time
 import threading
+import queue
 import ctypes
 import win32gui
 import subprocess
@@ -31,7 +32,9 @@ class MemoryGame(tk.Tk):
 
         # --- TTS engine ---
         self.tts_engine = pyttsx3.init()
-        self.tts_lock   = threading.Lock()
+        # One speech thread owns the engine; say_text just queues, in order
+        self.tts_queue  = queue.SimpleQueue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
 
         # --- Mode & player state ---
         self.mode_type      = 'single'   # 'single','two_casual','two_competitive'
@@ -128,11 +131,15 @@ class MemoryGame(tk.Tk):
 
     # ----------------- TTS Helpers -----------------
     def say_text(self, txt):
-        threading.Thread(target=self._speak, args=(txt,), daemon=True).start()
-    def _speak(self, txt):
-        with self.tts_lock:
-            self.tts_engine.say(txt)
-            self.tts_engine.runAndWait()
+        self.tts_queue.put(txt)
+    def _tts_worker(self):
+        while True:
+            txt = self.tts_queue.get()
+            try:
+                self.tts_engine.say(txt)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                print("TTS error:", e)
     def create_tts_button(self, parent, text, cmd, font_size=36, pady=10):
         btn = tk.Button(parent, text=text, command=cmd,
                         font=("Arial",font_size), bg="gray", activebackground="gray")
@@ -174,14 +181,6 @@ class MemoryGame(tk.Tk):
         self.menu_scan_index = (self.menu_scan_index + 1) % len(self.menu_buttons)
         self.update_menu_scan_highlight()
 
-    def move_pause_menu_scan_forward(self):
-        # skip debounce so pause always responds immediately
-        if not self.pause_scanned:
-            self.pause_scanned = True
-        else:
-            self.pause_scan_index = (self.pause_scan_index + 1) % len(self.pause_buttons)
-        self.update_pause_menu_scan_highlight()
-
     def select_mode(self, mode):
         self.mode_type = mode
         if mode == 'two_competitive':
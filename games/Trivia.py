@@ -7,54 +7,170 @@ import time
 import threading
 import pyttsx3
 import subprocess
-import queue
 import re
 import sys
 import ctypes
+import ctypes.wintypes
 import win32gui
+import pickle
 import os, sys, random, tkinter as tk
 from tkinter.font import Font
+from collections import deque
 import pandas as pd, pyttsx3, subprocess, time, threading
 
-GAMES_DIR    = os.path.dirname(__file__)
+GAMES_DIR    = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR     = os.path.dirname(GAMES_DIR)
 DATA_DIR     = os.path.join(ROOT_DIR, "data")
 IMG_DIR      = os.path.join(ROOT_DIR, "images")
+TRIVIA_PARQUET = os.path.join(DATA_DIR, "trivia_questions.parquet")
+TRIVIA_CSV   = os.path.join(DATA_DIR, "trivia_questions.csv")
 TRIVIA_XLSX  = os.path.join(DATA_DIR, "trivia_questions.xlsx")
+TRIVIA_CACHE = os.path.join(DATA_DIR, "trivia_questions.cache.v2.pkl")
 TRIVIA_IMG   = os.path.join(IMG_DIR, "trivia.png")
 
+# Win32 foreground-change hook (SetWinEventHook)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT   = 0x0000
+GA_ROOT                 = 2
+WinEventProc = ctypes.WINFUNCTYPE(
+    None, ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD, ctypes.wintypes.HWND,
+    ctypes.wintypes.LONG, ctypes.wintypes.LONG, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD
+)
+
 # --------------------- TTS ---------------------
 _engine = pyttsx3.init()
-_speak_lock = threading.Lock()
+# UI thread appends, the speech thread pops; deque ops are atomic, the Event is only a wake-up
+_speak_ring = deque()
+_speak_wake = threading.Event()
+_last_spoken = None  # most recent utterance still queued or playing
+
+def speak(text: str, interrupt: bool = False):
+    global _last_spoken
+    if interrupt:
+        interrupt_speak()
+    elif text == _last_spoken:
+        return  # the same words are already queued or being spoken
+    _last_spoken = text
+    _speak_ring.append(text)
+    _speak_wake.set()
+
+def interrupt_speak():
+    """Drop queued utterances and cut off the one playing (used on screen changes)."""
+    global _last_spoken
+    _last_spoken = None
+    _speak_ring.clear()
+    try:
+        _engine.stop()
+    except Exception as e:
+        print("[Trivia] TTS stop error", e)
+
+def _speak_worker():
+    # Single consumer: blocks on the queue instead of one thread per utterance
+    global _last_spoken
+    while True:
+        _speak_wake.wait()
+        _speak_wake.clear()
+        # Drain everything queued before sleeping again, one wake-up per burst
+        while True:
+            try:
+                msg = _speak_ring.popleft()
+            except IndexError:
+                break
+            try:
+                _engine.say(msg)
+                _engine.runAndWait()
+            except Exception as e:
+                print("[Trivia] TTS error", e)
+            if not _speak_ring:
+                _last_spoken = None  # finished talking; a repeat is worth saying again
 
-def speak(text: str):
-    def _run(msg):
-        with _speak_lock:
-            _engine.say(msg)
-            _engine.runAndWait()
-    threading.Thread(target=_run, args=(text,), daemon=True).start()
+threading.Thread(target=_speak_worker, daemon=True).start()
 
 # -------------------- Data ---------------------
+def trivia_source():
+    """Pick the question file to load: whichever of Parquet, CSV or xlsx was edited last."""
+    newest, newest_mtime = TRIVIA_XLSX, None
+    for path in (TRIVIA_PARQUET, TRIVIA_CSV, TRIVIA_XLSX):
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            continue  # that format isn't present
+        if newest_mtime is None or mtime > newest_mtime:
+            newest, newest_mtime = path, mtime
+    return newest
+
+def read_trivia_frame(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    if path.endswith(".csv"):
+        return pd.read_csv(path)
+    try:
+        return pd.read_excel(path, engine="calamine")
+    except (ImportError, ValueError):
+        # python-calamine not installed (or pandas too old) – use the default engine
+        return pd.read_excel(path)
+
 def load_trivia():
+    source = trivia_source()
+
+    # Reuse the pickled dict while the source file's path+mtime+size are unchanged
+    try:
+        st = os.stat(source)  # one stat for both halves of the key
+        key = (source, st.st_mtime, st.st_size)
+    except OSError:
+        key = None
+    if key is not None:
+        try:
+            with open(TRIVIA_CACHE, "rb") as f:
+                cached_key, cached_data = pickle.load(f)
+            if cached_key == key:
+                return cached_data
+        except FileNotFoundError:
+            pass  # no cache yet
+        except Exception as e:
+            print("[Trivia] Cache load error", e)
+
     data = {}
     try:
-        df = pd.read_excel(TRIVIA_XLSX)
-        for _, row in df.iterrows():
-            topic = row["Topic"]
+        df = read_trivia_frame(source)
+        df = df.dropna(subset=["Correct"])  # skip rows with no answer marked instead of failing the load
+        # Walk plain column lists rather than boxing every row into a Series
+        columns = zip(
+            df["Topic"].tolist(),
+            df["Question"].tolist(),
+            *(df[f"Choice{i}"].tolist() for i in range(1,5)),
+            df["Correct"].astype(int).tolist()
+        )
+        for topic, question, c1, c2, c3, c4, correct in columns:
+            # tag each choice with whether it is the answer, once, at load time
             q = {
-                "question": row["Question"],
-                "choices": [row[f"Choice{i}"] for i in range(1,5)],
-                "correct": int(row["Correct"])
+                "question": question,
+                "pairs": tuple((text, i == correct) for i, text in enumerate((c1, c2, c3, c4)))
             }
             data.setdefault(topic, []).append(q)
     except Exception as e:
-        print("[Trivia] Excel load error", e)
+        print(f"[Trivia] Load error ({os.path.basename(source)})", e)
+        return data
+
+    # question pools are read-only from here on
+    data = {topic: tuple(qs) for topic, qs in data.items()}
+
+    if key is not None:
+        try:
+            with open(TRIVIA_CACHE, "wb") as f:
+                pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print("[Trivia] Cache save error", e)
     return data
 
 TRIVIA_DATA = load_trivia()
+TRIVIA_TOPICS = sorted(TRIVIA_DATA)
 
 # ---------------- Base Frame -------------------
 class MenuFrame(tk.Frame):
+    reusable = False  # True: TriviaApp keeps one instance and re-packs it
+    greeting = None   # spoken each time the page is shown
+
     def __init__(self, parent, title=""):
         super().__init__(parent, bg="black")
         self.parent = parent
@@ -67,6 +183,7 @@ class MenuFrame(tk.Frame):
 
         self.buttons = []
         self.cur_idx = -1
+        self.lit_btn = None  # button currently painted yellow
         self.space_pressed_time = None
 
         # Control bar
@@ -89,34 +206,45 @@ class MenuFrame(tk.Frame):
             fg="white", bg="black"
         ).pack(pady=int(20*s))
 
-        # Key bindings
+        self.hold_id = None  # pending after() id for the long-hold backward scan
+
+    def activate(self):
+        """Take over the scan keys and reset scan state; called on every show."""
         self.bind_all("<KeyPress-space>", self.start_hold)
         self.bind_all("<KeyRelease-space>", self.space_released)
         self.bind_all("<KeyRelease-Return>", self.select_btn)
-        self.hold_thread = None
+        self.cancel_hold()
+        self.space_pressed_time = None
+        self.cur_idx = -1
+        if self.lit_btn is not None:
+            self.lit_btn.config(bg="light blue")
+            self.lit_btn = None
+        if self.greeting:
+            self.after(100, lambda: speak(self.greeting))
 
     # --------- scanning logic ---------
     def start_hold(self, evt):
-        if self.space_pressed_time is None:
-            self.space_pressed_time = time.time()
-            self.hold_thread = threading.Thread(
-                target=self.monitor_hold, daemon=True
-            )
-            self.hold_thread.start()
-
-    def monitor_hold(self):
-        while self.space_pressed_time is not None:
-            held = time.time() - self.space_pressed_time
-            if held >= 5:
-                self.cur_idx = (self.cur_idx - 1) % len(self.buttons)
-                self.highlight(self.cur_idx)
-                time.sleep(1.5)
-            else:
-                time.sleep(0.1)
+        # key auto-repeat fires KeyPress repeatedly; only the first one starts a hold
+        if self.space_pressed_time is not None:
+            return
+        self.space_pressed_time = time.time()
+        self.hold_id = self.after(5000, self.hold_step)
+
+    def hold_step(self):
+        """While space stays down past 5s, step backward every 1.5s."""
+        self.cur_idx = (self.cur_idx - 1) % len(self.buttons)
+        self.highlight(self.cur_idx)
+        self.hold_id = self.after(1500, self.hold_step)
+
+    def cancel_hold(self):
+        if self.hold_id is not None:
+            self.after_cancel(self.hold_id)
+            self.hold_id = None
 
     def space_released(self, evt):
         if self.space_pressed_time is None:
             return
+        self.cancel_hold()
         if time.time() - self.space_pressed_time < 5:
             if self.cur_idx == -1:
                 self.cur_idx = 0
@@ -130,9 +258,13 @@ class MenuFrame(tk.Frame):
             self.buttons[self.cur_idx].invoke()
 
     def highlight(self, index):
-        for i, b in enumerate(self.buttons):
-            b.config(bg="yellow" if i == index else "light blue")
-        speak(self.buttons[index]["text"])
+        # only repaint the outgoing and incoming buttons
+        btn = self.buttons[index]
+        if self.lit_btn is not None and self.lit_btn is not btn:
+            self.lit_btn.config(bg="light blue")
+        btn.config(bg="yellow")
+        self.lit_btn = btn
+        speak(btn["text"])
 
     # ---------- grid helper ----------
     def create_button_grid(self, items, columns=3):
@@ -179,17 +311,49 @@ class TriviaApp(tk.Tk):
         self.frame = None
         self.correct = 0
         self.wrong = 0
+        self._header_imgs = {}
+        self._pages = {}  # reusable page class -> its single instance
         self.show(HomePage)
 
-        # start up our background threads to keep focus and slam the Start Menu shut
-        threading.Thread(target=self.monitor_focus,      daemon=True).start()
-        threading.Thread(target=self.monitor_start_menu, daemon=True).start()
+        # get told about foreground changes to keep focus and slam the Start Menu shut
+        self._tk_hwnd = self.winfo_id()
+        self._refocus_until = 0.0  # monotonic; foreground events before this are our own doing
+        self._hook_state = None    # set by the hook thread: "ok" or "failed"
+        threading.Thread(target=self.watch_foreground, daemon=True).start()
+        self.after(250, self.await_hook)
+
+    def header_image(self, w_frac, h_frac):
+        """trivia.png scaled to fit the given screen fractions; decoded once per size."""
+        key = (w_frac, h_frac)
+        if key not in self._header_imgs:
+            img = None
+            if os.path.isfile(TRIVIA_IMG):
+                img = tk.PhotoImage(file=TRIVIA_IMG)
+                w, h = img.width(), img.height()
+                max_w = int(self.winfo_screenwidth() * w_frac)
+                max_h = int(self.winfo_screenheight() * h_frac)
+                ratio = min(max_w/w, max_h/h, 1.0)
+                img = img.subsample(int(1/ratio), int(1/ratio))
+            self._header_imgs[key] = img
+        return self._header_imgs[key]
 
     def show(self, cls, *a):
+        interrupt_speak()
         if self.frame:
-            self.frame.destroy()
-        self.frame = cls(self, *a)
-        self.frame.pack(expand=True, fill="both")
+            self.frame.cancel_hold()
+            if self.frame.reusable:
+                self.frame.pack_forget()
+            else:
+                self.frame.destroy()
+        if cls.reusable:
+            frame = self._pages.get(cls)
+            if frame is None:
+                frame = self._pages[cls] = cls(self, *a)
+        else:
+            frame = cls(self, *a)
+        self.frame = frame
+        frame.pack(expand=True, fill="both")
+        frame.activate()
 
     def quit_to_main(self):
         menu = os.path.join(ROOT_DIR, "comm-v10.py")
@@ -199,16 +363,65 @@ class TriviaApp(tk.Tk):
 
         # ---------------- Monitor Focus & Close Start Menu-------------
 
-    def monitor_focus(self):
-        """Ensure this application stays in focus."""
-        while True:
-            time.sleep(0.5)  # Check every 500ms
+    def watch_foreground(self):
+        """Pump Win32 messages for a foreground-change hook; falls back to polling."""
+        user32 = ctypes.windll.user32
+
+        def on_foreground(hook, event, hwnd, id_object, id_child, thread_id, ms):
             try:
-                hwnd = ctypes.windll.user32.GetForegroundWindow()
-                if hwnd != self.winfo_id():
-                    self.force_focus()
+                if self.is_start_menu_open():
+                    print("Start Menu detected. Closing it now.")
+                    self.send_esc_key()
+                    return
             except Exception as e:
-                print(f"Focus monitoring error: {e}")
+                print(f"Error closing Start Menu: {e}")
+            if not hwnd:
+                return
+            own = user32.GetAncestor(self._tk_hwnd, GA_ROOT) or self._tk_hwnd
+            if (user32.GetAncestor(hwnd, GA_ROOT) or hwnd) == own:
+                return
+            # force_focus's iconify/deiconify fires foreground events of its own;
+            # ignore them for a moment so the refocus can't feed itself
+            if time.monotonic() < self._refocus_until:
+                return
+            self._refocus_until = time.monotonic() + 1.0
+            self.after_idle(self.force_focus)
+
+        # keep a reference so ctypes doesn't free the callback while hooked
+        self._fg_proc = WinEventProc(on_foreground)
+        hook = user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND,
+            0, self._fg_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+        )
+        if not hook:
+            self._hook_state = "failed"  # await_hook starts the poll on the Tk thread
+            return
+        self._hook_state = "ok"
+        msg = ctypes.wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+        user32.UnhookWinEvent(hook)
+
+    def await_hook(self):
+        """Tk-thread check of the hook thread's outcome; falls back to polling if it failed."""
+        if self._hook_state is None:
+            self.after(250, self.await_hook)
+        elif self._hook_state == "failed":
+            print("Foreground hook unavailable; polling focus instead.")
+            self.monitor_focus()
+
+    def monitor_focus(self):
+        """Fallback poll: close the Start Menu, else keep focus (re-checked every 500ms)."""
+        try:
+            if self.is_start_menu_open():
+                print("Start Menu detected. Closing it now.")
+                self.send_esc_key()
+            elif ctypes.windll.user32.GetForegroundWindow() != self.winfo_id():
+                self.force_focus()
+        except Exception as e:
+            print(f"Focus monitoring error: {e}")
+        self.after(500, self.monitor_focus)
 
     def force_focus(self):
         """Force this application to the foreground."""
@@ -218,6 +431,9 @@ class TriviaApp(tk.Tk):
             ctypes.windll.user32.SetForegroundWindow(self.winfo_id())
         except Exception as e:
             print(f"Error forcing focus: {e}")
+        finally:
+            # the events this just caused arrive after we return
+            self._refocus_until = time.monotonic() + 0.5
 
     def send_esc_key(self):
         """Send the ESC key to close the Start Menu."""
@@ -231,67 +447,49 @@ class TriviaApp(tk.Tk):
         class_name = win32gui.GetClassName(hwnd)  # Get the class name of the active window
         return class_name in ["Shell_TrayWnd", "Windows.UI.Core.CoreWindow"]
 
-    def monitor_start_menu(self):
-        """Continuously check and close the Start Menu if it is open."""
-        while True:
-            try:
-                if self.is_start_menu_open():
-                    print("Start Menu detected. Closing it now.")
-                    self.send_esc_key()
-            except Exception as e:
-                print(f"Error in monitor_start_menu: {e}")
-            time.sleep(0.5)  # Adjust frequency as needed
 # ---------------- Pages ------------------
 class HomePage(MenuFrame):
+    reusable = True
+    greeting = "Trivia Game"
+
     def __init__(self, app):
         super().__init__(app, "Trivia Game")
         s = app.ui_scale
 
-        if os.path.isfile(TRIVIA_IMG):
-            img = tk.PhotoImage(file=TRIVIA_IMG)
-            # auto-scale header image
-            w = img.width()
-            h = img.height()
-            max_w = int(self.winfo_screenwidth() * 0.8)
-            max_h = int(self.winfo_screenheight() * 0.3)
-            ratio = min(max_w/w, max_h/h, 1.0)
-            img = img.subsample(int(1/ratio), int(1/ratio))
+        # auto-scaled header image (cached on the app)
+        img = app.header_image(0.8, 0.3)
+        if img:
             tk.Label(self, image=img, bg="black").pack(pady=int(10*s))
-            self.img = img
 
         self.create_button_grid([
             ("Choose Topic", lambda: app.show(TopicPage)),
             ("Exit Game",    app.quit_to_main)
         ], 1)
-        self.after(100, lambda: speak("Trivia Game"))
 
 class TopicPage(MenuFrame):
+    reusable = True
+    greeting = "Select a topic"
+
     def __init__(self, app):
         super().__init__(app, "Select Topic")
         items = [("Back", lambda: app.show(HomePage))]
-        items += [(t, lambda t=t: app.show(GamePage, t)) for t in sorted(TRIVIA_DATA.keys())]
+        items += [(t, lambda t=t: app.show(GamePage, t)) for t in TRIVIA_TOPICS]
         self.create_button_grid(items, 3)
-        self.after(100, lambda: speak("Select a topic"))
 
 class GamePage(MenuFrame):
     def __init__(self, app, topic):
         super().__init__(app, f"{topic} – 20 Questions")
         self.app = app
         self.topic = topic
-        self.qs = random.sample(TRIVIA_DATA[topic], min(20, len(TRIVIA_DATA[topic])))
+        pool = TRIVIA_DATA[topic]
+        self.qs = [pool[i] for i in random.sample(range(len(pool)), min(20, len(pool)))]
         self.idx = 0
         s = app.ui_scale
 
         # header image
-        if os.path.isfile(TRIVIA_IMG):
-            img = tk.PhotoImage(file=TRIVIA_IMG)
-            w, h = img.width(), img.height()
-            max_w = int(self.winfo_screenwidth() * 0.6)
-            max_h = int(self.winfo_screenheight() * 0.3)
-            ratio = min(max_w/w, max_h/h, 1.0)
-            img = img.subsample(int(1/ratio), int(1/ratio))
+        img = app.header_image(0.6, 0.3)
+        if img:
             tk.Label(self, image=img, bg="black").pack(pady=int(5*s))
-            self.img = img
 
         # question label
         qsize = max(12, int(28 * s))
@@ -353,14 +551,15 @@ class GamePage(MenuFrame):
         self.q_lbl.config(text=q["question"])
         self.stat.config(text=f"Question {self.idx+1}/{len(self.qs)}")
 
-        choices = list(enumerate(q["choices"]))
-        random.shuffle(choices)
-        self.correct_idx = next(i for i,(orig,_) in enumerate(choices) if orig==q["correct"])
-        for i, (_, text) in enumerate(choices):
+        # walk one random permutation of the slots; note the correct slot on the way
+        for i, orig in enumerate(random.sample(range(4), 4)):
+            text, is_correct = q["pairs"][orig]
+            if is_correct:
+                self.correct_idx = i
             self.a_btns[i].config(text=text, bg="light blue", state=tk.NORMAL)
 
         self.cur_idx = -1
-        self.after(100, lambda: speak(q["question"]))
+        self.after(100, lambda: speak(q["question"], interrupt=True))
 
     def pick(self, i):
         if i == self.correct_idx:
@@ -5,6 +5,7 @@ import time
 import threading
 import queue
 import subprocess
+import sys
 import os
 import win32gui
 import ctypes
@@ -92,7 +93,7 @@ class BaseballGame:
         self.away_team = "Red"    # you bat in top half
 
         self.engine = pyttsx3.init()
-        self.tts_queue = queue.Queue()
+        self.tts_queue = queue.SimpleQueue()  # single consumer, never joined
         threading.Thread(target=self._tts_worker, daemon=True).start()
         self.reset_game_state()
 
@@ -163,7 +164,6 @@ class BaseballGame:
             self.engine.say(text)
             self.engine.runAndWait()
             self.tts_playing = False
-            self.tts_queue.task_done()
 
     def speak(self, text):
         self.tts_queue.put(text)
@@ -350,7 +350,7 @@ class BaseballGame:
         elif sel == "Exit Game":
             current_dir = os.path.dirname(os.path.abspath(__file__))
             comm_v9_path = os.path.join(current_dir, "..", "comm-v10.py")
-            subprocess.Popen(["python", comm_v9_path])
+            subprocess.Popen([sys.executable, comm_v9_path])
             self.root.quit()
             quit()
               
@@ -918,49 +918,6 @@ class BaseballGame:
                 callback()
         animate(0)
 
-    def update_game_after_play(self, outcome):
-        self.canvas.delete("ball_marker")
-        self.canvas.delete("pitch_marker")
-        if outcome in {"Ground Out", "Strike Out", "Pop Fly Out", "Steal Failed", "Double Play"}:
-            if outcome == "Pop Fly Out":
-                x1, y1, x2, y2 = self.pitchers_box
-                while True:
-                    rx = random.randint(int(self.field_coords["third"][0]), int(self.field_coords["first"][0]))
-                    ry = random.randint(int(self.field_coords["second"][1]), int(self.field_coords["home"][1]))
-                    if not (x1 <= rx <= x2 and y1 <= ry <= y2):
-                        break
-                self.canvas.create_text(rx, ry, text="X", font=("Arial", int(30 * self.base_scale)),
-                                        fill="red", tags="ball_marker")
-            elif outcome == "Ground Out":
-                fx, fy = self.field_coords["first"]
-                self.canvas.create_text(fx + 10, fy, text="X", font=("Arial", int(30 * self.base_scale)),
-                                        fill="red", tags="ball_marker")
-            self.outs += 1
-        if outcome in {"Strike", "Strike Out"}:
-            self.draw_pitch_marker(self.selected_pitch_location, color="red")
-        elif outcome in {"Ball"}:
-            self.draw_pitch_marker(self.selected_pitch_location, color="white")
-        self.canvas.delete("base")
-        self.draw_bases()
-        self.canvas.delete("scoreboard")
-        self.draw_scoreboard()
-        self.root.after(random.randint(4000, 7000), self.continue_game)
-
-    def continue_game(self):
-        if self.outs >= 3:
-            self.end_half_inning()
-        else:
-            if self.half == "top":
-                self.start_batting_phase()
-            else:
-                self.start_pitching_phase()
-
-    def continue_at_bat(self):
-        if self.half == "top":
-            self.root.after(1000, self.start_batting_phase)
-        else:
-            self.root.after(1000, self.start_pitching_phase)
-
     # ---------- Bottom Half: Player Pitches (Computer Bats) ----------
     # Remove pitch location selection; the pitch location is now chosen randomly.
     def start_pitching_phase(self):
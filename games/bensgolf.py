@@ -3,6 +3,7 @@ import pyttsx3
 import math
 import time
 import subprocess
+import sys
 import threading
 import ctypes
 import win32gui
@@ -516,8 +517,8 @@ def menu():
                         menu_running = False
                     else:
                         current_dir = os.path.dirname(os.path.abspath(__file__))
-                        comm_v9_path = os.path.join(current_dir, "..", "comm-v9.py")
-                        subprocess.Popen(["python", comm_v9_path])
+                        comm_v9_path = os.path.join(current_dir, "..", "comm-v10.py")
+                        subprocess.Popen([sys.executable, comm_v9_path])
                         pygame.quit()
                         quit()
         scaled_surface = pygame.transform.scale(virtual_surface, screen.get_size())
@@ -5,6 +5,7 @@ import time
 import subprocess
 import pyttsx3
 import threading
+import queue
 import os
 import sys
 import win32gui
@@ -26,9 +27,10 @@ class TicTacToeGame(tk.Tk):
         close_btn = tk.Button(top_frame, text="X", command=self.on_exit, font=("Arial", 12))
         close_btn.pack(side="right", padx=5, pady=5)
 
-        # Initialize TTS engine and a lock for thread-safety.
+        # Initialize TTS engine; a single speech thread owns it, so no lock is needed.
         self.tts_engine = pyttsx3.init()
-        self.tts_lock = threading.Lock()
+        self.tts_queue = queue.SimpleQueue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
 
         # Scanning state variables:
         self.current_mode = None  # Modes: "main_menu", "game", "pause", "game_over_menu"
@@ -124,14 +126,18 @@ class TicTacToeGame(tk.Tk):
                 print(f"Error in monitor_start_menu: {e}")
             time.sleep(0.5)  # Adjust frequency as needed
 
-    # --- TTS Methods (with lock) ---
+    # --- TTS Methods (queued to one worker) ---
     def say_text(self, text):
-        threading.Thread(target=self._speak, args=(text,)).start()
+        self.tts_queue.put(text)
 
-    def _speak(self, text):
-        with self.tts_lock:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+    def _tts_worker(self):
+        while True:
+            text = self.tts_queue.get()
+            try:
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                print("TTS error:", e)
 
     # --- Helper for Creating Buttons with TTS (for menus/pauses) ---
     def create_tts_button(self, parent, text, command, font_size=36, pady=10):
@@ -248,14 +254,6 @@ class TicTacToeGame(tk.Tk):
             else:
                 btn.config(bg=default_color, relief="flat", bd=0, activebackground=default_color)
 
-    def move_game_board_scan_forward(self):
-        self.game_board_scan_index = (self.game_board_scan_index + 1) % len(self.game_board_order)
-        self.update_game_board_scan_highlight()
-
-    def move_game_board_scan_backward(self):
-        self.game_board_scan_index = (self.game_board_scan_index - 1) % len(self.game_board_order)
-        self.update_game_board_scan_highlight()
-
     def select_cell(self, r, c):
         # In single-player mode, only allow the X player (human) to make a move.
         if self.game_mode == "single" and self.current_turn != "X":
@@ -44,7 +44,7 @@ pygame.mixer.music.play(-1)
 # Initialize TTS (separate from pygame mixer)
 engine = pyttsx3.init()
 engine.setProperty('volume', 1.0)
-tts_queue = queue.Queue()
+tts_queue = queue.SimpleQueue()  # single consumer, never joined
 def tts_worker():
     while True:
         text = tts_queue.get()
@@ -55,7 +55,6 @@ def tts_worker():
             engine.runAndWait()
         except Exception as e:
             print("TTS error:", e)
-        tts_queue.task_done()
 
 tts_thread = threading.Thread(target=tts_worker, daemon=True)
 tts_thread.start()
@@ -468,8 +467,8 @@ def update_tower_units():
     for unit in tower_units:
         if unit.target is None or unit.target not in enemies or unit.target.hp <= 0:
             unit.locked_target = None  # Clear previous lock
-            sorted_candidates = sorted(enemies, key=lambda e: math.hypot(e.x - unit.x, e.y - unit.y))
-            unit.target = sorted_candidates[0] if sorted_candidates else None
+            # Only the nearest is needed, so a linear min beats sorting every enemy
+            unit.target = min(enemies, key=lambda e: math.hypot(e.x - unit.x, e.y - unit.y), default=None)
 
     # STEP 3: Resolve conflicts if multiple units are targeting the same enemy.
     # For each enemy, if more than one unit is targeting it, only the unit closest to the enemy should keep it.
@@ -1274,10 +1273,10 @@ threading.Thread(target=monitor_start_menu, daemon=True).start()
 # ------------------------------ #
 
 def close_game():
-    # Launch comm-v9.py from the parent directory.
+    # Launch comm-v10.py from the parent directory.
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    comm_v9_path = os.path.join(current_dir, "..", "comm-v9.py")
-    subprocess.Popen(["python", comm_v9_path])
+    comm_v9_path = os.path.join(current_dir, "..", "comm-v10.py")
+    subprocess.Popen([sys.executable, comm_v9_path])
     pygame.quit()
     exit()
 
@@ -1310,7 +1309,7 @@ def main_menu():
                 mouse_pos = pygame.mouse.get_pos()
                 close_rect, min_rect = draw_window_controls()
                 if close_rect.collidepoint(mouse_pos):
-                    close_game()  # Ensure comm-v9.py launches on window close
+                    close_game()  # Ensure comm-v10.py launches on window close
                 if min_rect.collidepoint(mouse_pos):
                     pygame.display.iconify()
 
@@ -21,7 +21,7 @@ class WordJumbleGame(tk.Tk):
 
         # Initialize TTS engine and set up a dedicated TTS thread.
         self.tts_engine = pyttsx3.init()
-        self.tts_queue = queue.Queue()
+        self.tts_queue = queue.SimpleQueue()  # single consumer, never joined
         self.tts_thread = threading.Thread(target=self.process_tts_queue, daemon=True)
         self.tts_thread.start()
         self.protocol("WM_DELETE_WINDOW", self.exit_game)
@@ -557,7 +557,7 @@ class WordJumbleGame(tk.Tk):
         self.tts_thread.join(timeout=2)
         self.destroy()
         current_dir = os.path.dirname(__file__)
-        comm_v9_path = os.path.join(current_dir, "..", "comm-v9.py")
+        comm_v9_path = os.path.join(current_dir, "..", "comm-v10.py")
         subprocess.Popen([sys.executable, comm_v9_path])
 
     # ---------------- Remove Letter Option (via Pause Menu) ----------------
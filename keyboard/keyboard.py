@@ -8,9 +8,41 @@ import subprocess
 import sys
 import os
 import ctypes
+import logging
+import re
 import win32gui
+from collections import deque
+from functools import partial
 from keyboard_predictive import get_predictive_suggestions, update_word_usage
 
+TEXT_BAR_FONT = ("Arial Black", 72)
+# Shared options for the Minimize/Close buttons along the top of the window
+MINIMIZE_BUTTON_OPTS = {"text": "Minimize", "bg": "light blue", "fg": "black", "font": ("Arial", 12)}
+CLOSE_BUTTON_OPTS = {"text": "Close", "bg": "red", "fg": "white", "font": ("Arial", 12)}
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")  # read long text a sentence at a time
+
+# Per-keypress/scan trace; silent unless the app configures logging at DEBUG
+log = logging.getLogger("keyboard")
+_BUTTON_FONTS = {}  # size -> ("Arial Bold", size), shared by every key
+
+def button_font(size):
+    font = _BUTTON_FONTS.get(size)
+    if font is None:
+        font = _BUTTON_FONTS[size] = ("Arial Bold", size)
+    return font
+
+def predictive_font_size(key):
+    """Font size for a predictive suggestion, shrinking as the word gets longer."""
+    if not key:
+        return 24  # If the key is empty, use a default small size.
+    if len(key) <= 5:
+        return 48
+    if len(key) <= 8:
+        return 36
+    if len(key) <= 12:
+        return 24
+    return 18
+
 class KeyboardFrameApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -34,17 +66,8 @@ class KeyboardFrameApp(tk.Tk):
         control_frame = tk.Frame(self, bg="gray")  # Change background color to make it visible
         control_frame.pack(side="top", fill="x")
 
-        minimize_button = tk.Button(
-            control_frame, text="Minimize", bg="light blue", fg="black",
-            command=self.iconify, font=("Arial", 12)
-        )
-        minimize_button.pack(side="right", padx=5, pady=5)
-
-        close_button = tk.Button(
-            control_frame, text="Close", bg="red", fg="white",
-            command=self.destroy, font=("Arial", 12)
-        )
-        close_button.pack(side="right", padx=5, pady=5)
+        tk.Button(control_frame, command=self.iconify, **MINIMIZE_BUTTON_OPTS).pack(side="right", padx=5, pady=5)
+        tk.Button(control_frame, command=self.destroy, **CLOSE_BUTTON_OPTS).pack(side="right", padx=5, pady=5)
 
     def monitor_focus(self):
         """Ensure this application stays in focus."""
@@ -101,15 +124,33 @@ class KeyboardFrame(tk.Frame):
         self.backward_scanning_active = False
         self.scanning_thread = None
         self.press_time = None  # To record the time when spacebar is pressed
+        self.return_press_time = None  # Set while Return is held
+        self.long_press_triggered = False
         self.debounce_time = 0.1
         self.toggle_cursor()
         self.tts_trigger_count = 0
 
-        self.tts_engine = pyttsx3.init()  # Initialize TTS engine
+        # Speech runs on its own thread so scanning never waits on runAndWait(),
+        # and the engine is created there too so SAPI setup never blocks the UI
+        self.tts_engine = None
+        self.speak_mailbox = deque(maxlen=1)  # only the newest request matters
+        self.speak_wake = threading.Event()
+        threading.Thread(target=self.play_speak_queue, daemon=True).start()
         
         # Initialize current mode
         self.current_mode = "Keyboard"  # Default mode is "Keyboard"
 
+        # Control buttons, looked up by label instead of walking an if/elif chain.
+        # Each handler gets the current text (cursor already stripped).
+        self.special_buttons = {
+            "Layout": lambda text: self.toggle_mode(),
+            "Main": lambda text: self.open_and_exit("comm-v10.py"),  # Close current script and open the main script.
+            "Back": lambda text: self.show_main_menu(),  # Return to the main Words Mode menu.
+            "Space": lambda text: self.current_text.set(text + " |"),
+            "Clear": lambda text: self.current_text.set("|"),  # Reset text with just the cursor.
+            "Del Word": lambda text: self.current_text.set(" ".join(text.split()[:-1]) + " |"),
+        }
+
         # Initialize rows and row_titles
         self.row_titles = [
             "Controls", "A-B-C-D-E-F", "G-H-I-J-K-L", "M-N-O-P-Q-R", "S-T-U-V-W-X", "Y-Z 1 2 3", "4 5 6 7 8 9", "Predictive Text"
@@ -137,10 +178,8 @@ class KeyboardFrame(tk.Frame):
     def update_predictive_text(self):
         """Dynamically updates the predictive text row in real-time."""
         text = self.current_text.get().strip()
-        print(f"DEBUG: Current text input = '{text}'")  # Debugging line
-
         suggestions = get_predictive_suggestions(text)
-        print(f"DEBUG: Predicted suggestions = {suggestions}")  # Debugging line
+        log.debug("Current text input = %r, predicted suggestions = %s", text, suggestions)
 
         # Ensure exactly 6 slots are filled in the predictive text row
         self.predictive_text_row[:] = suggestions + [""] * (6 - len(suggestions))
@@ -166,7 +205,7 @@ class KeyboardFrame(tk.Frame):
         self.text_bar_button = tk.Button(
             self,
             textvariable=self.current_text,
-            font=("Arial Black", 72),
+            font=TEXT_BAR_FONT,
             bg="light blue",
             command=self.read_text_tts,
             wraplength=1368,  # Adjust this value as needed for your layout
@@ -176,34 +215,23 @@ class KeyboardFrame(tk.Frame):
 
         # Create buttons for each row.
         self.buttons = []
+        predictive_row_index = len(self.rows) - 1  # The predictive row is assumed to be last.
+        keyboard_mode = self.current_mode == "Keyboard"
         for row_index, row_keys in enumerate(self.rows):
             button_row = []
             for col_index, key in enumerate(row_keys):
-                # If this is the predictive text row (assumed to be the last row), adjust font size.
-                if row_index == len(self.rows) - 1:
+                if row_index == predictive_row_index:
                     # For predictive row, use dynamic font sizing based on key length.
-                    if not key:
-                        # If the key is empty, use a default small size.
-                        font_size = 24
-                    else:
-                        # Adjust thresholds as desired.
-                        if len(key) <= 5:
-                            font_size = 48
-                        elif len(key) <= 8:
-                            font_size = 36
-                        elif len(key) <= 12:
-                            font_size = 24
-                        else:
-                            font_size = 18
+                    font_size = predictive_font_size(key)
                 else:
                     # For other rows, use your usual font sizing.
-                    font_size = 48 if self.current_mode == "Keyboard" else (12 if len(key) > 10 else 24)
+                    font_size = 48 if keyboard_mode else (12 if len(key) > 10 else 24)
                 btn = tk.Button(
                     self,
                     text=key,
-                    font=("Arial Bold", font_size),
+                    font=button_font(font_size),
                     bg="light blue",
-                    command=lambda k=key: self.handle_button_press(k),
+                    command=partial(self.handle_button_press, key),
                 )
                 btn.grid(row=row_index + 1, column=col_index, sticky="nsew")  # Offset by 1 for the text bar.
                 button_row.append(btn)
@@ -224,7 +252,7 @@ class KeyboardFrame(tk.Frame):
         return tk.Button(
             self,
             text=text,
-            font=("Arial Bold", font_size),
+            font=button_font(font_size),
             bg="light blue",
             command=command,
         )
@@ -263,23 +291,6 @@ class KeyboardFrame(tk.Frame):
             self.in_row_selection_mode = True
             self.highlight_row(0)
         
-    def create_window_controls(self):
-        """Adds Close and Minimize buttons to the top of the app window."""
-        control_frame = tk.Frame(self, bg="gray")  # Change background color to make it visible
-        control_frame.pack(side="top", fill="x")
-
-        minimize_button = tk.Button(
-            control_frame, text="Minimize", bg="light blue", fg="black",
-            command=self.iconify, font=("Arial", 12)
-        )
-        minimize_button.pack(side="right", padx=5, pady=5)
-
-        close_button = tk.Button(
-            control_frame, text="Close", bg="red", fg="white",
-            command=self.destroy, font=("Arial", 12)
-        )
-        close_button.pack(side="right", padx=5, pady=5)
-
     def bind_keys(self):
         """Bind keys for scanning and selecting."""
         self.bind_all("<KeyPress-space>", self.start_scanning)
@@ -298,10 +309,10 @@ class KeyboardFrame(tk.Frame):
 
     def start_selecting(self, event):
         # Record the time when the Return key is pressed.
-        if not hasattr(self, "return_press_time") or self.return_press_time is None:
+        if self.return_press_time is None:
             self.return_press_time = time.time()
             self.long_press_triggered = False  # Reset the long-press flag.
-            print("Return key pressed.")
+            log.debug("Return key pressed.")
             # Schedule a callback to check if the key is held for 3 seconds.
             self.after(3000, self.check_long_press)
 
@@ -320,26 +331,51 @@ class KeyboardFrame(tk.Frame):
             self.in_row_selection_mode = True
             self.highlight_row(self.current_row_index)
             self.long_press_triggered = True
-            print("Long press detected: Jumped to predictive text row.")
+            log.debug("Long press detected: Jumped to predictive text row.")
             # Call TTS on the predictive row.
             self.read_predictive_tts()
 
+    def speak(self, *phrases):
+        """Queue phrases to be spoken together, replacing anything not yet started."""
+        self.speak_mailbox.append(phrases)  # maxlen=1 evicts the stale request
+        self.speak_wake.set()
+
+    def play_speak_queue(self):
+        try:
+            self.tts_engine = pyttsx3.init()  # Initialize TTS engine
+        except Exception as e:
+            print(f"TTS init error: {e}")
+            return
+        while True:
+            self.speak_wake.wait()
+            self.speak_wake.clear()  # cleared before popping, so a later append always re-wakes us
+            try:
+                phrases = self.speak_mailbox.popleft()
+            except IndexError:
+                continue
+            try:
+                for phrase in phrases:
+                    if self.speak_mailbox:
+                        break  # a newer request came in; drop the rest of this one
+                    self.tts_engine.say(phrase)
+                    self.tts_engine.runAndWait()
+            except Exception as e:
+                print(f"TTS error: {e}")
+
     def read_predictive_tts(self):
         """
         Reads each suggestion in the predictive text row aloud.
         """
-        for word in self.predictive_text_row:
-            if word.strip():  # Skip empty placeholders
-                self.tts_engine.say(word.lower())  # lowercase avoids spelling letters
-        self.tts_engine.runAndWait()
+        # lowercase avoids spelling letters; skip empty placeholders
+        self.speak(*(word.lower() for word in self.predictive_text_row if word.strip()))
 
     def stop_selecting(self, event):
-        if hasattr(self, "return_press_time") and self.return_press_time is not None:
+        if self.return_press_time is not None:
             press_duration = time.time() - self.return_press_time
-            print(f"Return key released after {press_duration:.2f} seconds.")
+            log.debug("Return key released after %.2f seconds.", press_duration)
             # If a long press was not triggered, handle as a short press.
             if not self.long_press_triggered and press_duration >= 0.1:
-                print("Short press detected: Select action triggered.")
+                log.debug("Short press detected: Select action triggered.")
                 self.select_button()
             # Reset the press time and long-press flag.
             self.return_press_time = None
@@ -350,7 +386,7 @@ class KeyboardFrame(tk.Frame):
         if not self.spacebar_pressed:
             self.spacebar_pressed = True
             self.spacebar_press_time = time.time()  # Record the press time
-            print("Spacebar pressed.")
+            log.debug("Spacebar pressed.")
 
             # Start a thread to monitor backward scanning
             threading.Thread(target=self.monitor_backward_scanning, daemon=True).start()
@@ -360,11 +396,11 @@ class KeyboardFrame(tk.Frame):
         if self.spacebar_pressed:
             self.spacebar_pressed = False
             press_duration = time.time() - self.spacebar_press_time
-            print(f"Spacebar released after {press_duration:.2f} seconds.")
+            log.debug("Spacebar released after %.2f seconds.", press_duration)
             
             # Forward scanning if held between 0.25 and 3 seconds
             if 0.25 <= press_duration <= 3:
-                print("Scanning forward by one selection.")
+                log.debug("Scanning forward by one selection.")
                 self.scan_forward()
 
             # Reset tracking variables
@@ -376,7 +412,7 @@ class KeyboardFrame(tk.Frame):
             press_duration = time.time() - self.spacebar_press_time
 
             if press_duration > 3:
-                print("Spacebar held for more than 3 seconds. Scanning backward.")
+                log.debug("Spacebar held for more than 3 seconds. Scanning backward.")
                 self.scan_backward()
                 time.sleep(1)# Scan backward every 1 seconds while held
 
@@ -387,7 +423,7 @@ class KeyboardFrame(tk.Frame):
         """Monitor the duration of the spacebar press and handle forward scanning."""
         time.sleep(1)  # Wait for 1 second before starting scanning
         if self.spacebar_pressed:
-            print("Spacebar held for 1 second. Starting forward scanning.")
+            log.debug("Spacebar held for 1 second. Starting forward scanning.")
             while self.spacebar_pressed:
                 self.scan_forward()  # Trigger forward scan
                 time.sleep(2)  # Wait for 2 seconds between scans
@@ -401,11 +437,11 @@ class KeyboardFrame(tk.Frame):
             # Move to the next row, looping back if necessary
             prev_row_index = self.current_row_index
             self.current_row_index = (self.current_row_index + 1) % (len(self.rows) + 1)  # Include the text bar
-            print(f"Scanning forward to row {self.current_row_index}")
+            log.debug("Scanning forward to row %d", self.current_row_index)
 
             self.highlight_row(self.current_row_index, prev_row_index)
             if self.current_row_index == 0:
-                print("Text bar highlighted.")
+                log.debug("Text bar highlighted.")
             else:
                 self.speak_row_title(self.current_row_index)
         else:
@@ -430,11 +466,11 @@ class KeyboardFrame(tk.Frame):
             # Move to the previous row, looping back if necessary
             prev_row_index = self.current_row_index
             self.current_row_index = (self.current_row_index - 1) % (len(self.rows) + 1)  # Include the text bar
-            print(f"Scanning backward to row {self.current_row_index}")
+            log.debug("Scanning backward to row %d", self.current_row_index)
 
             self.highlight_row(self.current_row_index, prev_row_index)
             if self.current_row_index == 0:
-                print("Text bar highlighted.")
+                log.debug("Text bar highlighted.")
             else:
                 self.speak_row_title(self.current_row_index)
         else:
@@ -504,7 +540,7 @@ class KeyboardFrame(tk.Frame):
             # Highlight the current row
             for button in self.buttons[row_index - 1]:
                 button.config(bg="yellow")
-        self.update_idletasks()
+        # No update_idletasks(): the main loop repaints on its next idle pass
 
     def highlight_button(self, button_index, prev_button_index=None):
         """Highlight the current button and reset the previous button."""
@@ -512,7 +548,6 @@ class KeyboardFrame(tk.Frame):
             self.buttons[self.current_row_index - 1][prev_button_index].config(bg="light blue", fg="black")
 
         self.buttons[self.current_row_index - 1][button_index].config(bg="yellow", fg="black")
-        self.update_idletasks()
 
     def speak_row_title(self, row_index):
         """Speak the title of the current row."""
@@ -536,16 +571,14 @@ class KeyboardFrame(tk.Frame):
                 title = ""  # No title for rows beyond defined row_titles
 
         if title:
-            print(f"TTS: {title}")  # Debugging line
-            self.tts_engine.say(title)
-            self.tts_engine.runAndWait()
+            log.debug("TTS: %s", title)
+            self.speak(title)
 
     def speak_button_label(self, button_index):
         """Speak the label of the current button."""
         label = self.rows[self.current_row_index - 1][button_index]
         # Convert label to lowercase to avoid TTS spelling out short words
-        self.tts_engine.say(label.lower())
-        self.tts_engine.runAndWait()
+        self.speak(label.lower())
         
     def handle_button_press(self, char):
         # Get the current text without the cursor.
@@ -567,29 +600,18 @@ class KeyboardFrame(tk.Frame):
         # If we're in Words mode, use volume keys instead of adding text.
         if self.current_mode == "Words":
             if char == "Vol+":
-                print("Increasing volume by 6 steps (Words mode).")
+                log.debug("Increasing volume by 6 steps (Words mode).")
                 self.change_volume(up=True, steps=6)
                 return  # Do not update the text box
             elif char == "Vol-":
-                print("Decreasing volume by 6 steps (Words mode).")
+                log.debug("Decreasing volume by 6 steps (Words mode).")
                 self.change_volume(up=False, steps=6)
                 return  # Do not update the text box
     
         # --- Special Buttons ---
-        if char == "Layout":
-            self.toggle_mode()
-        elif char == "Main":
-            self.open_and_exit("comm-v9.py")  # Close current script and open the main script.
-        elif char == "Back":
-            self.show_main_menu()  # Return to the main Words Mode menu.
-        elif char in ["Space", "Del Word", "Clear"]:
-            if char == "Space":
-                self.current_text.set(text + " |")
-            elif char == "Clear":
-                self.current_text.set("|")  # Reset text with just the cursor.
-            elif char == "Del Word":
-                words = text.split()
-                self.current_text.set(" ".join(words[:-1]) + " |")
+        special = self.special_buttons.get(char)
+        if special is not None:
+            special(text)
         
         # --- Keyboard Mode (Normal Letter Buttons) ---
         elif self.current_mode == "Keyboard":
@@ -604,7 +626,7 @@ class KeyboardFrame(tk.Frame):
             submenus = self.get_submenus()
             if char in submenus:
                 self.show_submenu(char)
-            elif char in [word for row in self.rows for word in row]:
+            elif any(char in row for row in self.rows):
                 self.current_text.set(text + char + "|")
         
         # Always update predictive suggestions after handling the button press.
@@ -664,8 +686,7 @@ class KeyboardFrame(tk.Frame):
         """Reads the current text with TTS and tracks word usage after 3 triggers."""
         text = self.current_text.get().strip()
         if text:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            self.speak(*SENTENCE_SPLIT.split(text))
             self.tts_trigger_count += 1  # Increment counter
 
             if self.tts_trigger_count >= 3:
@@ -1,43 +1,230 @@
 # © 2025 NARBE House – Licensed under CC BY-NC 4.0
 
+import atexit
+import bisect
+import heapq
 import json
 import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import orjson  # much faster load/save of the large n-gram file
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # vectorized scoring when a prefix matches many words
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # compiles the scoring loop below when installed
+except ImportError:
+    njit = None
 
 # Define paths for predictive text data
 PREDICTIVE_FILE = os.path.join(os.path.dirname(__file__), "predictive_ngrams.json")
+# Pickled copy of the cleaned-up data, reused while the JSON file is unchanged
+PREDICTIVE_CACHE = os.path.join(os.path.dirname(__file__), "predictive_ngrams.cache.pkl")
+
+# Word usage is written back at most this often (seconds) and once more on exit
+SAVE_INTERVAL = 10
+
+# Repeated lookups of the same text within this many seconds reuse the last result
+PREDICTION_TTL = 2
+
+# Default suggestions if nothing is typed (and filler when predictions run short)
+DEFAULT_WORDS = ("YES", "NO", "HELP")
+
+# Below this many matching words the plain Python loop beats building NumPy slices
+NUMPY_MIN_CANDIDATES = 256
 
 # Global variable to store JSON data (prevents reloading every keystroke)
 predictive_data = {}
 
+# Context -> [(next_word, data), ...] so Tier 1 is one dict lookup per keystroke.
+# The data dicts are shared with predictive_data, so count updates show up here too.
+# One-letter next words are never suggested, so they are left out up front.
+ngram_index = {"bigrams": defaultdict(list), "trigrams": defaultdict(list)}
+
+def index_ngram(ngram_type, key, data):
+    ctx, _, next_word = key.rpartition(" ")
+    if len(next_word) >= 2:
+        ngram_index[ngram_type][ctx].append((next_word, data))
+
+# Frequent words in sorted order; a prefix's completions are one contiguous slice.
+sorted_words = []
+
+# (counts, last_used, lengths) arrays aligned with sorted_words, built on demand
+_freq_arrays = None
+
+def prefix_range(prefix):
+    lo = bisect.bisect_left(sorted_words, prefix)
+    hi = bisect.bisect_left(sorted_words, prefix + "\uffff")
+    return lo, hi
+
+def freq_arrays():
+    global _freq_arrays
+    if _freq_arrays is None:
+        frequent_words = predictive_data["frequent_words"]
+        entries = [frequent_words[w] for w in sorted_words]
+        _freq_arrays = (
+            np.array([d.get("count", 0) for d in entries], dtype=np.float64),
+            np.array([d.get("last_used", 0) for d in entries], dtype=np.float64),
+            np.array([len(w) for w in sorted_words], dtype=np.int32),
+        )
+    return _freq_arrays
+
+def build_indexes():
+    global _freq_arrays
+    for ngram_type in ("bigrams", "trigrams"):
+        ngram_index[ngram_type].clear()
+        for key, data in predictive_data[ngram_type].items():
+            index_ngram(ngram_type, key, data)
+    sorted_words[:] = sorted(predictive_data["frequent_words"])
+    _freq_arrays = None
+
 # Load JSON data once and ensure all words are uppercase
 def load_json():
     global predictive_data
-    if not os.path.exists(PREDICTIVE_FILE) or os.stat(PREDICTIVE_FILE).st_size == 0:
+    # One stat answers "exists", "empty" and the cache key
+    try:
+        st = os.stat(PREDICTIVE_FILE)
+    except OSError:
+        st = None
+    if st is None or st.st_size == 0:
         predictive_data = {"frequent_words": {}, "bigrams": {}, "trigrams": {}}
         return
 
+    key = json_file_key(st)
     try:
-        with open(PREDICTIVE_FILE, "r", encoding="utf-8") as file:
-            predictive_data = json.load(file)
+        with open(PREDICTIVE_CACHE, "rb") as file:
+            cached_key, cached_data = pickle.load(file)
+        if cached_key == key:
+            predictive_data = cached_data
+            build_indexes()
+            print("✅ Predictive cache Loaded. Sample words:", list(islice(predictive_data["frequent_words"], 10)))
+            return
+    except FileNotFoundError:
+        pass  # first run, or the cache was deleted
+    except Exception as e:
+        print(f"Failed to load predictive cache: {e}")
+
+    try:
+        if orjson:
+            with open(PREDICTIVE_FILE, "rb") as file:
+                predictive_data = orjson.loads(file.read())
+        else:
+            with open(PREDICTIVE_FILE, "r", encoding="utf-8") as file:
+                predictive_data = json.load(file)
 
         # Convert all words to uppercase for consistency
         predictive_data["frequent_words"] = {k.upper(): v for k, v in predictive_data["frequent_words"].items()}
         predictive_data["bigrams"] = {k.upper(): v for k, v in predictive_data["bigrams"].items()}
         predictive_data["trigrams"] = {k.upper(): v for k, v in predictive_data["trigrams"].items()}
+        migrate_timestamps()
+        build_indexes()
 
-        print("✅ Predictive JSON Loaded. Sample words:", list(predictive_data["frequent_words"].keys())[:10])
+        print("✅ Predictive JSON Loaded. Sample words:", list(islice(predictive_data["frequent_words"], 10)))
     except json.JSONDecodeError:
         predictive_data = {"frequent_words": {}, "bigrams": {}, "trigrams": {}}
+        return
+
+    save_cache(key)
+
+# Guards predictive_data while the autosave thread serializes it
+_save_lock = threading.Lock()
+_dirty = False
+_autosave_thread = None
+
+def migrate_timestamps():
+    """Older files store last_used as ISO strings; scoring wants plain epoch seconds."""
+    for section in ("frequent_words", "bigrams", "trigrams"):
+        for data in predictive_data[section].values():
+            last_used = data.get("last_used", 0)
+            if isinstance(last_used, str):
+                try:
+                    data["last_used"] = datetime.fromisoformat(last_used).timestamp()
+                except ValueError:
+                    data["last_used"] = 0.0
+
+def json_file_key(st=None):
+    if st is None:
+        st = os.stat(PREDICTIVE_FILE)
+    return (st.st_mtime, st.st_size)
+
+def write_atomic(path, data):
+    """Write bytes to a temp file beside `path`, then swap it in, so a crash never leaves a half-written file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def save_cache(key):
+    try:
+        write_atomic(PREDICTIVE_CACHE, pickle.dumps((key, predictive_data), protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        print(f"Failed to save predictive cache: {e}")
 
 # Save JSON data
 def save_json():
-    with open(PREDICTIVE_FILE, "w", encoding="utf-8") as file:
-        json.dump(predictive_data, file, indent=4)
+    global _dirty
+    with _save_lock:
+        _dirty = False
+        if orjson:
+            data = orjson.dumps(predictive_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(predictive_data, indent=4).encode("utf-8")
+        write_atomic(PREDICTIVE_FILE, data)
+        save_cache(json_file_key())
+
+def flush_word_usage():
+    """Write pending usage updates, if any, to disk."""
+    if _dirty:
+        save_json()
+
+def _autosave_loop():
+    while True:
+        time.sleep(SAVE_INTERVAL)
+        try:
+            flush_word_usage()
+        except Exception as e:
+            print(f"Failed to save predictive data: {e}")
+
+atexit.register(flush_word_usage)
+
+def recency_terms(data, now_ts):
+    """
+    Returns (recency, recency_bonus) for an entry: a small term that favors recent
+    use, plus a huge bonus if it was used within the past hour or week.
+    """
+    time_diff = now_ts - data.get("last_used", 0)  # time difference in seconds
+    recency = 1 / (time_diff + 1)  # higher value for more recent usage
 
-from datetime import datetime
+    if time_diff < 3600:  # within 1 hour
+        return recency, 10000
+    if time_diff < 604800:  # within 1 week (604800 seconds)
+        return recency, 5000
+    return recency, 0
 
-def compute_ngram_score(data, ngram_type, candidate, current_word):
+def compute_ngram_score(data, ngram_type, candidate, current_word, now_ts):
     """
     Compute a composite score for an n-gram candidate based on:
       - Its usage count.
@@ -47,29 +234,14 @@ def compute_ngram_score(data, ngram_type, candidate, current_word):
       
     Revised: If the candidate was used within the past week, it gets a huge bonus.
     """
-    try:
-        last_used = datetime.fromisoformat(data.get("last_used", "1970-01-01T00:00:00"))
-    except Exception:
-        last_used = datetime(1970, 1, 1)
-    now = datetime.now()
-    time_diff = (now - last_used).total_seconds()  # time difference in seconds
-    recency = 1 / (time_diff + 1)  # higher value for more recent usage
-
-    # NEW: Revised recency bonus for the past week.
-    if time_diff < 3600:  # within 1 hour
-        recency_bonus = 10000
-    elif time_diff < 604800:  # within 1 week (604800 seconds)
-        recency_bonus = 5000
-    else:
-        recency_bonus = 0
-
+    recency, recency_bonus = recency_terms(data, now_ts)
     multiplier = 10 if ngram_type == "trigrams" else 5
     base_score = multiplier * (data.get("count", 0) + recency) + recency_bonus
     letter_bonus = (len(candidate) - len(current_word)) * 20
     extra_letter_bonus = 40 if (len(candidate) - len(current_word)) > 3 else 0
     return base_score + letter_bonus + extra_letter_bonus
 
-def compute_freq_score(data):
+def compute_freq_score(data, now_ts):
     """
     Compute a score for a frequent-word candidate based on:
       - Its usage count.
@@ -77,26 +249,83 @@ def compute_freq_score(data):
       
     Revised: If the word was used within the past week, it gets a very high bonus.
     """
-    try:
-        last_used = datetime.fromisoformat(data.get("last_used", "1970-01-01T00:00:00"))
-    except Exception:
-        last_used = datetime(1970, 1, 1)
-    now = datetime.now()
-    time_diff = (now - last_used).total_seconds()
-    recency = 1 / (time_diff + 1)
-    if time_diff < 3600:
-        recency_bonus = 10000
-    elif time_diff < 604800:
-        recency_bonus = 5000
-    else:
-        recency_bonus = 0
+    recency, recency_bonus = recency_terms(data, now_ts)
     return data.get("count", 0) + recency * 20 + recency_bonus
 
+def _score_slice_numpy(counts, last_used, lengths, now_ts):
+    """compute_freq_score over parallel arrays; words under 2 letters get -inf."""
+    time_diff = now_ts - last_used
+    recency = 1 / (time_diff + 1)
+    recency_bonus = np.where(time_diff < 3600, 10000, np.where(time_diff < 604800, 5000, 0))
+    scores = counts + recency * 20 + recency_bonus
+    scores[lengths < 2] = -np.inf
+    return scores
+
+def _score_slice_loop(counts, last_used, lengths, now_ts):
+    """Same as _score_slice_numpy as one pass with no temporaries, for Numba."""
+    scores = np.empty(counts.shape[0], dtype=np.float64)
+    for i in range(counts.shape[0]):
+        if lengths[i] < 2:
+            scores[i] = -np.inf
+            continue
+        time_diff = now_ts - last_used[i]
+        recency = 1 / (time_diff + 1)
+        if time_diff < 3600:
+            recency_bonus = 10000
+        elif time_diff < 604800:
+            recency_bonus = 5000
+        else:
+            recency_bonus = 0
+        scores[i] = counts[i] + recency * 20 + recency_bonus
+    return scores
+
+if np is not None and njit is not None:
+    score_slice = njit(cache=True)(_score_slice_loop)
+    # Compile now rather than on the first keystroke
+    score_slice(np.zeros(1), np.zeros(1), np.full(1, 2, dtype=np.int32), 0.0)
+else:
+    score_slice = _score_slice_numpy
+
+def rank_frequent_words(prefix, now_ts, limit):
+    """
+    Returns up to `limit` (word, score) completions of `prefix`, best first.
+    Words equal to the prefix or shorter than 2 letters are skipped; ties keep
+    alphabetical order.
+    """
+    lo, hi = prefix_range(prefix)
+    if limit <= 0 or lo == hi:
+        return []
+
+    if np is None or hi - lo < NUMPY_MIN_CANDIDATES:
+        frequent_words = predictive_data["frequent_words"]
+        ranked = ((w, compute_freq_score(frequent_words[w], now_ts))
+                  for w in sorted_words[lo:hi] if w != prefix and len(w) >= 2)
+        return heapq.nlargest(limit, ranked, key=itemgetter(1))
+
+    # Same formula as compute_freq_score, over the whole slice at once
+    counts, last_used, lengths = freq_arrays()
+    scores = score_slice(counts[lo:hi], last_used[lo:hi], lengths[lo:hi], now_ts)
+    if sorted_words[lo] == prefix:
+        scores[0] = -np.inf
+
+    candidates = np.flatnonzero(scores > -np.inf)
+    if len(candidates) > limit:
+        kth = np.partition(scores[candidates], -limit)[-limit]
+        candidates = candidates[scores[candidates] >= kth]
+    order = candidates[np.lexsort((candidates, -scores[candidates]))][:limit]
+    return [(sorted_words[lo + i], float(scores[i])) for i in order]
+
 def get_predictive_suggestions(text, num_suggestions=6):
     """
     Returns a list of predictive suggestions based on the current text input.
     This version favors recently used rolling trigrams (and bigrams) over frequent words.
     """
+    # Backspace/retype and layout rebuilds ask for the same text again and again
+    time_bucket = int(time.time() // PREDICTION_TTL)
+    return list(_cached_suggestions(text, num_suggestions, time_bucket))
+
+@lru_cache(maxsize=512)
+def _cached_suggestions(text, num_suggestions, time_bucket):
     # Check if the text (without the "|" cursor marker) ends with a space.
     has_trailing_space = text.rstrip("|").endswith(" ")
 
@@ -104,119 +333,119 @@ def get_predictive_suggestions(text, num_suggestions=6):
     cleaned = text.upper().replace("|", "").strip()
     words = cleaned.split()
 
-    # Default suggestions if nothing is typed
-    DEFAULT_WORDS = ["YES", "NO", "HELP"]
+    # One clock read per keystroke, shared by every candidate's recency score
+    now_ts = time.time()
 
     # --- Tier 0: If no words are entered, return frequent words first ---
     if not words:
-        default_predictions = []
-        for word, data in predictive_data.get("frequent_words", {}).items():
-            if len(word) >= 2:
-                score = compute_freq_score(data)
-                default_predictions.append((word, score))
-        sorted_default = sorted(default_predictions, key=lambda x: -x[1])
-        final_predictions = [w for w, _ in sorted_default[:num_suggestions]]
+        final_predictions = [w for w, _ in rank_frequent_words("", now_ts, num_suggestions)]
         for w in DEFAULT_WORDS:
             if w not in final_predictions:
                 final_predictions.append(w)
         return final_predictions[:num_suggestions]
 
     # --- Determine context and current (incomplete) word ---
+    # Sliced from the one split above rather than re-joined and re-split
     if has_trailing_space:
-        context = cleaned
+        ctx_words = words
         current_word = ""
     else:
+        ctx_words = words[:-1]
         current_word = words[-1]
-        context = " ".join(words[:-1])
 
     # --- Tier 1: N-gram predictions with rolling trigrams ---
     predictions_ngram = {}
-    if context and (has_trailing_space or context != current_word):
-        ctx_words = context.split()
-
+    if ctx_words and (has_trailing_space or ctx_words != [current_word]):
         # rolling contexts
-        tri_ctx = " ".join(ctx_words[-2:]) if len(ctx_words) >= 2 else context
-        bi_ctx  = ctx_words[-1]           if len(ctx_words) >= 1 else ""
-
-        # look up trigrams using only the last two words
-        for key, data in predictive_data.get("trigrams", {}).items():
-            if key.startswith(tri_ctx + " "):
-                next_word = key.split()[-1]
-                if (current_word == "" or next_word.startswith(current_word)) \
-                   and len(next_word) >= 2 and data.get("count", 0) >= 1:
-                    score = compute_ngram_score(data, "trigrams", next_word, current_word)
-                    predictions_ngram[next_word] = predictions_ngram.get(next_word, 0) + score
-
-        # fallback to bigrams on the very last word
-        for key, data in predictive_data.get("bigrams", {}).items():
-            if key.startswith(bi_ctx + " "):
-                next_word = key.split()[-1]
-                if (current_word == "" or next_word.startswith(current_word)) \
-                   and len(next_word) >= 2 and data.get("count", 0) >= 1:
-                    score = compute_ngram_score(data, "bigrams", next_word, current_word)
+        tri_ctx = " ".join(ctx_words[-2:])
+        bi_ctx  = ctx_words[-1]
+
+        # trigrams on the last two words, then bigrams on the very last word
+        for ngram_type, ngram_ctx in (("trigrams", tri_ctx), ("bigrams", bi_ctx)):
+            for next_word, data in ngram_index[ngram_type].get(ngram_ctx, ()):
+                # startswith("") is always true, so an empty current word needs no special case
+                if next_word.startswith(current_word) and data.get("count", 0) >= 1:
+                    score = compute_ngram_score(data, ngram_type, next_word, current_word, now_ts)
                     predictions_ngram[next_word] = predictions_ngram.get(next_word, 0) + score
 
     # --- Tier 2: Frequent word completions ---
-    predictions_freq = {}
-    for word, data in predictive_data.get("frequent_words", {}).items():
-        if word.startswith(current_word) and word != current_word and len(word) >= 2:
-            score = compute_freq_score(data)
-            predictions_freq[word] = score
+    # Skipped when n-grams already fill the row; otherwise fetch only enough to
+    # fill it even if every n-gram word also shows up here
+    predictions_freq = []
+    if len(predictions_ngram) < num_suggestions:
+        predictions_freq = rank_frequent_words(current_word, now_ts, num_suggestions + len(predictions_ngram))
 
     # --- Tier 3: Combine candidates (n-grams first, then freq, then defaults) ---
     final_predictions = []
+    seen = set()  # mirrors final_predictions for O(1) duplicate checks
 
     if predictions_ngram:
-        for w, _ in sorted(predictions_ngram.items(), key=lambda x: -x[1]):
+        # Only the top few can survive the final slice
+        for w, _ in heapq.nlargest(num_suggestions, predictions_ngram.items(), key=itemgetter(1)):
             final_predictions.append(w)
+            seen.add(w)
 
     if len(final_predictions) < num_suggestions:
-        for w, _ in sorted(predictions_freq.items(), key=lambda x: -x[1]):
-            if w not in final_predictions:
+        for w, _ in predictions_freq:
+            if w not in seen:
                 final_predictions.append(w)
+                seen.add(w)
             if len(final_predictions) >= num_suggestions:
                 break
 
     for w in DEFAULT_WORDS:
-        if w not in final_predictions:
+        if w not in seen:
             final_predictions.append(w)
 
     return final_predictions[:num_suggestions]
 
 
 def update_word_usage(text):
+    global _dirty, _autosave_thread, _freq_arrays
     # Remove the cursor indicator from the text.
     text = text.replace("|", "")
     words = text.strip().upper().split()
-    timestamp = datetime.now().isoformat()
-
-    # Update frequent words without a length restriction.
-    for word in words:
-        if word in predictive_data["frequent_words"]:
-            predictive_data["frequent_words"][word]["count"] += 1
-            predictive_data["frequent_words"][word]["last_used"] = timestamp
-        else:
-            predictive_data["frequent_words"][word] = {"count": 1, "last_used": timestamp}
-
-    # Update bigrams.
-    for i in range(len(words) - 1):
-        bigram = f"{words[i]} {words[i+1]}"
-        if bigram in predictive_data["bigrams"]:
-            predictive_data["bigrams"][bigram]["count"] += 1
-            predictive_data["bigrams"][bigram]["last_used"] = timestamp
-        else:
-            predictive_data["bigrams"][bigram] = {"count": 1, "last_used": timestamp}
-
-    # Update trigrams.
-    for i in range(len(words) - 2):
-        trigram = f"{words[i]} {words[i+1]} {words[i+2]}"
-        if trigram in predictive_data["trigrams"]:
-            predictive_data["trigrams"][trigram]["count"] += 1
-            predictive_data["trigrams"][trigram]["last_used"] = timestamp
-        else:
-            predictive_data["trigrams"][trigram] = {"count": 1, "last_used": timestamp}
-
-    save_json()  # Save updates
+    timestamp = time.time()
+
+    with _save_lock:
+        _freq_arrays = None  # counts/recency are about to change
+
+        # Update frequent words without a length restriction.
+        for word in words:
+            if word in predictive_data["frequent_words"]:
+                predictive_data["frequent_words"][word]["count"] += 1
+                predictive_data["frequent_words"][word]["last_used"] = timestamp
+            else:
+                predictive_data["frequent_words"][word] = {"count": 1, "last_used": timestamp}
+                bisect.insort(sorted_words, word)
+
+        # Update bigrams.
+        for i in range(len(words) - 1):
+            bigram = f"{words[i]} {words[i+1]}"
+            if bigram in predictive_data["bigrams"]:
+                predictive_data["bigrams"][bigram]["count"] += 1
+                predictive_data["bigrams"][bigram]["last_used"] = timestamp
+            else:
+                predictive_data["bigrams"][bigram] = {"count": 1, "last_used": timestamp}
+                index_ngram("bigrams", bigram, predictive_data["bigrams"][bigram])
+
+        # Update trigrams.
+        for i in range(len(words) - 2):
+            trigram = f"{words[i]} {words[i+1]} {words[i+2]}"
+            if trigram in predictive_data["trigrams"]:
+                predictive_data["trigrams"][trigram]["count"] += 1
+                predictive_data["trigrams"][trigram]["last_used"] = timestamp
+            else:
+                predictive_data["trigrams"][trigram] = {"count": 1, "last_used": timestamp}
+                index_ngram("trigrams", trigram, predictive_data["trigrams"][trigram])
+
+        _dirty = True
+    _cached_suggestions.cache_clear()
+
+    # Saved in the background instead of rewriting the whole file per call
+    if _autosave_thread is None:
+        _autosave_thread = threading.Thread(target=_autosave_loop, daemon=True)
+        _autosave_thread.start()
 
 # Load data once when script starts
 load_json()
@@ -3,13 +3,15 @@ import os
 import sys
 import time
 import json
+import socket
 import threading
+import ctypes
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 
 import tkinter as tk
 
 import psutil
-import pyautogui
 import win32gui
 import win32con
 import win32api
@@ -17,6 +19,7 @@ from urllib.parse import urlparse
 import difflib
 import subprocess
 import shutil
+import tempfile
 # Optional low-level hotkey library (strong combo handling)
 try:
     import keyboard as _kbd  # pip install keyboard
@@ -42,6 +45,9 @@ POLL_INTERVAL = 0.75
 SCAN_DEBOUNCE = 0.35  # seconds after a scan/select before we accept another
 SPACE_HOLD_DELAY = 3.0   # seconds to hold before auto-scan starts
 SPACE_HOLD_REPEAT = 1.0  # repeat interval while holding Space
+CDP_PORT = 9222          # Chrome --remote-debugging-port
+CDP_PROBE_TIMEOUT = 0.1  # seconds; loopback connects answer well inside this
+GA_ROOT = 2              # GetAncestor flag: the top-level window
 
 # ------------------------------ Platform profiles ------------------------------
 PlatformProfile = Dict[str, Any]
@@ -69,6 +75,20 @@ PROFILES: List[PlatformProfile] = [
      "playpause": ["space"], "fullscreen": ["f"], "post_nav": ["f"]},
 ]
 
+# Virtual-key codes for the key names used in the profiles
+VK_CODES: Dict[str, int] = {"enter": 0x0D, "return": 0x0D, "space": 0x20}
+VK_CODES.update((c, ord(c.upper())) for c in "abcdefghijklmnopqrstuvwxyz")
+
+# Resolve each post_nav sequence to VK codes once, instead of per launch
+for _prof in PROFILES:
+    _prof["post_nav_vk"] = tuple(VK_CODES[k.lower()] for k in _prof["post_nav"] if k.lower() in VK_CODES)
+del _prof
+
+
+def _tap_vk(vk: int):
+    win32api.keybd_event(vk, 0, 0, 0)
+    win32api.keybd_event(vk, 0, win32con.KEYEVENTF_KEYUP, 0)
+
 # ------------------------------ Episode cache ------------------------------
 EPISODE_CACHE: Dict[str, Dict[int, List[Dict[str, Any]]]] = {}
 # Linear (row) order per show for strict next/prev by spreadsheet order
@@ -76,13 +96,12 @@ EPISODE_LINEAR: Dict[str, List[Dict[str, Any]]] = {}
 
 
 def load_last_watched() -> dict:
-    if os.path.exists(LAST_WATCHED_FILE):
-        try:
-            with open(LAST_WATCHED_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    # Missing file lands in the except too, so no separate exists() check
+    try:
+        with open(LAST_WATCHED_FILE, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
 
 
 def set_last_position(show_title: str, season: int, episode: int, url: str, linear_index: Optional[int] = None):
@@ -92,8 +111,19 @@ def set_last_position(show_title: str, season: int, episode: int, url: str, line
         rec["linear_index"] = int(linear_index)
     data[show_title] = rec
     os.makedirs(DATA_DIR, exist_ok=True)
-    with open(LAST_WATCHED_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    # Temp file + os.replace: the menu may be reading this file at the same moment
+    fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, LAST_WATCHED_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def load_episode_catalog():
@@ -109,11 +139,11 @@ def load_episode_catalog():
         print("[control_bar] pandas is required for episode mode:", e)
         return
 
-    if not os.path.exists(EPISODE_SHEET):
+    try:
+        df = pd.read_excel(EPISODE_SHEET)  # a missing sheet surfaces here, no separate exists() stat
+    except FileNotFoundError:
         print(f"[control_bar] Episode sheet not found: {EPISODE_SHEET}")
         return
-
-    df = pd.read_excel(EPISODE_SHEET)
     cols = {c.lower().strip(): c for c in df.columns}
 
     show_col = cols.get("show title") or cols.get("show") or cols.get("title")
@@ -195,32 +225,62 @@ def _enum_visible_windows() -> List[int]:
     return handles
 
 
+# Window focus_chrome_window last succeeded with; reused until it goes away
+_last_chrome_hwnd: Optional[int] = None
+
+def _is_live_chrome_window(hwnd: int) -> bool:
+    # IsWindow alone isn't enough: a closed window's handle can be recycled by another app
+    try:
+        return (win32gui.IsWindow(hwnd) and win32gui.IsWindowVisible(hwnd)
+                and (win32gui.GetClassName(hwnd) or "").lower().startswith("chrome"))
+    except Exception:
+        return False
+
 def focus_chrome_window() -> bool:
     """Bring a Chrome window to the foreground. Returns True on success."""
+    global _last_chrome_hwnd
+    # Try the remembered window first; the EnumWindows walk is only the fallback
+    if _last_chrome_hwnd and _is_live_chrome_window(_last_chrome_hwnd):
+        if _focus_hwnd(_last_chrome_hwnd):
+            return True
+    _last_chrome_hwnd = None
     for hwnd in _enum_chrome_windows():
-        try:
-            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            win32gui.SetForegroundWindow(hwnd)
-            time.sleep(0.05)
+        if _focus_hwnd(hwnd):
+            _last_chrome_hwnd = hwnd
             return True
-        except Exception:
-            continue
     return False
 
+def _focus_hwnd(hwnd: int) -> bool:
+    try:
+        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        win32gui.SetForegroundWindow(hwnd)
+        time.sleep(0.05)
+        return True
+    except Exception:
+        return False
+
 
 def close_chrome():
     hwnd = win32gui.GetForegroundWindow()
     title = win32gui.GetWindowText(hwnd)
-    if "chrome".lower() in title.lower():
-        pyautogui.hotkey("alt", "f4")
+    if "chrome" in title.lower():
+        # Post the WM_CLOSE that Alt+F4 would produce, without loading pyautogui to type it
+        win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
         return
     def _enum(hwnd, _res):
         t = win32gui.GetWindowText(hwnd)
-        if t and "chrome".lower() in t.lower():
+        if t and "chrome" in t.lower():
             win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
     win32gui.EnumWindows(_enum, None)
 
+# Primary display size, as pyautogui.size() reports it; queried once per process
+@lru_cache(maxsize=1)
+def _screen_size():
+    return win32api.GetSystemMetrics(win32con.SM_CXSCREEN), win32api.GetSystemMetrics(win32con.SM_CYSCREEN)
+
 # NEW: find Chrome executable path (best-effort on Windows)
+# Resolved once per process: the PATH walk and install-dir probes don't change between episodes
+@lru_cache(maxsize=1)
 def _find_chrome_exe() -> Optional[str]:
     # Try PATH first
     exe = shutil.which("chrome") or shutil.which("chrome.exe")
@@ -268,11 +328,20 @@ except Exception:
     websocket = None
 
 
+def cdp_port_open() -> bool:
+    """Cheap TCP probe so we skip the HTTP request when DevTools isn't listening."""
+    try:
+        socket.create_connection(("127.0.0.1", CDP_PORT), timeout=CDP_PROBE_TIMEOUT).close()
+        return True
+    except OSError:
+        return False
+
+
 def get_active_chrome_url_via_cdp() -> Optional[str]:
-    if not requests:
+    if not requests or not cdp_port_open():
         return None
     try:
-        r = requests.get("http://127.0.0.1:9222/json", timeout=0.3)
+        r = requests.get(f"http://127.0.0.1:{CDP_PORT}/json", timeout=0.3)
         tabs = r.json() if r.ok else []
         # Pick the first page tab; CDP doesn't always expose "active" without extra calls
         for t in tabs:
@@ -285,10 +354,10 @@ def get_active_chrome_url_via_cdp() -> Optional[str]:
 # ---------------- CDP helpers (no focus change) ----------------
 
 def _cdp_tabs():
-    if not requests:
+    if not requests or not cdp_port_open():
         return []
     try:
-        r = requests.get("http://127.0.0.1:9222/json", timeout=0.4)
+        r = requests.get(f"http://127.0.0.1:{CDP_PORT}/json", timeout=0.4)
         return r.json() if r.ok else []
     except Exception:
         return []
@@ -529,6 +598,7 @@ def _send_shift_arrow_pyautogui(direction: str) -> bool:
     if not focus_chrome_window():
         return False
     try:
+        import pyautogui
         time.sleep(0.05)  # give Chrome a tick to take focus
         pyautogui.keyDown("shift")
         time.sleep(0.01)
@@ -875,6 +945,7 @@ class ControlBar(tk.Tk):
         # Build button model, then draw widgets from it
         self.items: List[Dict[str, Any]] = self._make_items()
         self.tk_buttons: List[tk.Button] = []
+        self._lit_idx: Optional[int] = None  # button _highlight last painted yellow
         self.current_index = 0
         self._return_hold_thread: Optional[threading.Thread] = None
         # NEW: one-time activation click flag
@@ -884,13 +955,18 @@ class ControlBar(tk.Tk):
         self._restart_deadline = 0.0
         # NEW: map logical ids to button indices (e.g., prev/next)
         self._btn_idx: Dict[str, int] = {}
+        # Row in EPISODE_LINEAR for the current episode; seeded lazily by _ensure_linear_index
+        self._linear_idx: Optional[int] = None
         # NEW: SAPI TTS voice (async; purges previous utterance)
         self._tts = None
+        self._tts_speak = None  # bound Speak method, resolved once instead of per utterance
         if _win32com_client:
             try:
                 self._tts = _win32com_client.Dispatch("SAPI.SpVoice")
+                self._tts_speak = self._tts.Speak
             except Exception:
                 self._tts = None
+                self._tts_speak = None
 
         self._build_ui()
         self._highlight(0)
@@ -952,6 +1028,7 @@ class ControlBar(tk.Tk):
         row = tk.Frame(self, bg="#111111")
         row.pack(expand=True, fill=tk.BOTH)
         self.tk_buttons.clear()
+        self._lit_idx = None
         for it in self.items:
             b = tk.Button(
                 row,
@@ -974,24 +1051,26 @@ class ControlBar(tk.Tk):
 
     # ---------- Highlight helpers ----------
     def _highlight(self, idx: int):
-        for i, b in enumerate(self.tk_buttons):
-            if i == idx:
-                b.configure(bg="#ffd84d")  # yellow
-            else:
+        # The buttons are built once, so only the previously lit one needs resetting
+        lit = self._lit_idx
+        if lit is None:
+            for b in self.tk_buttons:
                 b.configure(bg="#e6f0ff")
-        self.update_idletasks()
+        elif lit != idx and lit < len(self.tk_buttons):
+            self.tk_buttons[lit].configure(bg="#e6f0ff")
+        self.tk_buttons[idx].configure(bg="#ffd84d")  # yellow
+        self._lit_idx = idx
         # NEW: announce the currently highlighted button
         self._announce_highlight(idx)
 
     # NEW: small helper to speak text (async + purge)
     def _speak(self, text: str):
-        if not text:
+        if not text or not self._tts_speak:
             return
-        if self._tts:
-            try:
-                self._tts.Speak(str(text), 3)  # 1=Async,2=Purge → 3
-            except Exception:
-                pass
+        try:
+            self._tts_speak(str(text), 3)  # 1=Async,2=Purge → 3
+        except Exception:
+            pass
 
     # UPDATED: verbalize current highlight; in episodes mode speak titles for prev/next
     def _announce_highlight(self, idx: int):
@@ -1158,7 +1237,7 @@ class ControlBar(tk.Tk):
                 break
             running = is_chrome_running()
             # If we are intentionally restarting Chrome, just wait (no action needed here)
-            if getattr(self, "_restarting_chrome", False):
+            if self._restarting_chrome:
                 # Let the restart window elapse; _switch_to_index clears the guard
                 continue
             # Previously this destroyed the bar when Chrome wasn't running. Keep the bar alive.
@@ -1168,12 +1247,27 @@ class ControlBar(tk.Tk):
         if not self.winfo_exists():
             return
         try:
-            self.attributes("-topmost", True)
-            self.lift()
+            # Re-assert topmost only when something actually covers the bar
+            if self._is_covered():
+                self.attributes("-topmost", True)
+                self.lift()
         except Exception:
             pass
         self.after(1500, self._raise_forever)
 
+    def _is_covered(self) -> bool:
+        """True when another top-level window is on top of the bar's centre (or we can't tell)."""
+        try:
+            # pywin32 doesn't wrap GetAncestor, so go through user32 directly
+            get_root = ctypes.windll.user32.GetAncestor
+            own = get_root(self.winfo_id(), GA_ROOT)
+            x = self.winfo_rootx() + self.winfo_width() // 2
+            y = self.winfo_rooty() + self.winfo_height() // 2
+            hit = win32gui.WindowFromPoint((x, y))
+            return not hit or get_root(hit, GA_ROOT) != own
+        except Exception:
+            return True  # fail open: raising needlessly beats losing the bar
+
     # ---------------- actions ----------------
     def _init_linear_index(self) -> Optional[int]:
         if not self.show_title:
@@ -1203,7 +1297,7 @@ class ControlBar(tk.Tk):
         return 0
 
     def _ensure_linear_index(self):
-        if getattr(self, "_linear_idx", None) is None:
+        if self._linear_idx is None:
             self._linear_idx = self._init_linear_index()
         if self._linear_idx is None:
             self._linear_idx = 0
@@ -1375,7 +1469,8 @@ class ControlBar(tk.Tk):
             else:
                 # Fallback: real OS click at screen center (may focus Chrome)
                 try:
-                    sw, sh = pyautogui.size()
+                    import pyautogui
+                    sw, sh = _screen_size()
                     pyautogui.click(sw // 2, sh // 2)
                     did = True
                 except Exception:
@@ -1485,6 +1580,7 @@ class ControlBar(tk.Tk):
         played_fullscreen = False
         if focus_chrome_window():
             try:
+                import pyautogui
                 time.sleep(0.2)
 
                 # Click inside Chrome window center (more reliable than screen center)
@@ -1495,42 +1591,23 @@ class ControlBar(tk.Tk):
                     pyautogui.click(cx, cy)
                 except Exception:
                     # Fallback: screen center
-                    sw, sh = pyautogui.size()
+                    sw, sh = _screen_size()
                     pyautogui.click(sw // 2, sh // 2)
                 time.sleep(0.12)
 
-                # Helper: map simple keys to VK codes
-                def _vk_for(k: str) -> Optional[int]:
-                    if not k:
-                        return None
-                    k = k.lower()
-                    if k in ("enter", "return"):
-                        return 0x0D
-                    if k in ("space",):
-                        return 0x20
-                    if len(k) == 1 and "a" <= k <= "z":
-                        return ord(k.upper())
-                    return None
-
                 # Run platform post-nav sequence first (e.g., Plex)
-                for key in (prof.get("post_nav") or []):
-                    vk = _vk_for(str(key))
-                    if vk is None:
-                        continue
-                    win32api.keybd_event(vk, 0, 0, 0)
-                    win32api.keybd_event(vk, 0, 2, 0)
+                for vk in prof.get("post_nav_vk", ()):
+                    _tap_vk(vk)
                     time.sleep(0.06)
 
                 # Decide play key by platform (YouTube prefers 'K', others 'Space')
-                play_vk = 0x4B if (prof and prof.get("name", "").lower() == "youtube") else 0x20  # 'K' or Space
-                win32api.keybd_event(play_vk, 0, 0, 0)
-                win32api.keybd_event(play_vk, 0, 2, 0)
+                play_vk = VK_CODES["k"] if (prof and prof.get("name", "").lower() == "youtube") else VK_CODES["space"]
+                _tap_vk(play_vk)
                 time.sleep(0.18)
 
                 # Send fullscreen 'F' a couple of times to catch late player init
                 for _ in range(2):
-                    win32api.keybd_event(0x46, 0, 0, 0)
-                    win32api.keybd_event(0x46, 0, 2, 0)
+                    _tap_vk(VK_CODES["f"])
                     time.sleep(0.18)
 
                 played_fullscreen = True
@@ -1552,8 +1629,7 @@ class ControlBar(tk.Tk):
             pass
         if focus_chrome_window():
             try:
-                win32api.keybd_event(0x46, 0, 0, 0)
-                win32api.keybd_event(0x46, 0, 2, 0)
+                _tap_vk(VK_CODES["f"])
             except Exception:
                 pass
         self._refocus_bar()